@@ -6,31 +6,62 @@ Provides integration with BoPi sensor controller devices via local HTTP API.
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, SERVICE_REFRESH
-from .coordinator import BoPiCoordinator
+from .const import DOMAIN, ENTITY_OPTIONS
+from .coordinator import BoPiCoordinator, snapshot_store
+from .registry import async_get_registry
 from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR, Platform.SWITCH]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)  # pylint: disable=invalid-name
+
 
 @dataclass
 class RuntimeData:
     """Class to hold bopi runtime data."""
 
     coordinator: BoPiCoordinator
+    setup_options: Mapping[str, Any] = field(default_factory=dict)
 
 
 type BoPiConfigEntry = ConfigEntry[RuntimeData]
 
 
+async def async_setup(
+    hass: HomeAssistant,
+    config: ConfigType,  # pylint: disable=unused-argument
+) -> bool:
+    """Set up the BoPi integration.
+
+    Services are registered once for the whole domain and reach every loaded
+    config entry through the coordinator registry.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        config: Configuration of Home Assistant.
+
+    Returns:
+    -------
+        True if setup successful.
+
+    """
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(hass: HomeAssistant, config_entry: BoPiConfigEntry) -> bool:
     """Set up BoPi integration from a config entry.
 
@@ -45,9 +76,17 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: BoPiConfigEntry)
 
     """
     coordinator = BoPiCoordinator(hass, config_entry)
-    await coordinator.async_config_entry_first_refresh()
 
-    config_entry.runtime_data = RuntimeData(coordinator)
+    # Come up at once from the last known state when there is one, and let the
+    # first live poll run in the background.
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
+
+    config_entry.runtime_data = RuntimeData(coordinator, dict(config_entry.options))
+    config_entry.async_on_unload(
+        async_get_registry(hass).register(config_entry.entry_id, coordinator)
+    )
 
     config_entry.async_on_unload(
         config_entry.add_update_listener(_async_update_listener)
@@ -55,17 +94,24 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: BoPiConfigEntry)
 
     await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
-    # Set up services
-    await async_setup_services(hass, config_entry.runtime_data)
+    if restored:
+        config_entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh(),
+            name=f"{DOMAIN} first refresh ({config_entry.unique_id})",
+        )
 
     return True
 
 
 async def _async_update_listener(
-    hass: HomeAssistant,  # pylint: disable=unused-argument
+    hass: HomeAssistant,
     config_entry: BoPiConfigEntry,
 ) -> None:
-    """Handle config options update.
+    """Handle config entry update.
+
+    Connection and polling changes are applied in place; only options that
+    change the set of entities reload the entry.
 
     Args:
     ----
@@ -73,9 +119,24 @@ async def _async_update_listener(
         config_entry: Config entry that changed.
 
     """
-    coordinator: BoPiCoordinator = config_entry.runtime_data.coordinator
-    # pylint: disable-next=protected-access
-    coordinator.update_interval = coordinator._get_update_interval()
+    runtime_data = config_entry.runtime_data
+    coordinator = runtime_data.coordinator
+
+    if any(
+        config_entry.options.get(option) != runtime_data.setup_options.get(option)
+        for option in ENTITY_OPTIONS
+    ):
+        hass.config_entries.async_schedule_reload(config_entry.entry_id)
+        return
+
+    coordinator.apply_options()
+    if coordinator.apply_connection():
+        _LOGGER.debug("Connection of %s changed, refreshing", config_entry.title)
+        config_entry.async_create_background_task(
+            hass,
+            coordinator.async_refresh_coalesced(),
+            name=f"{DOMAIN} refresh ({config_entry.unique_id})",
+        )
 
 
 async def async_unload_entry(
@@ -93,13 +154,18 @@ async def async_unload_entry(
         True if unload successful.
 
     """
-    # Unload platforms first
-    unload_ok = await hass.config_entries.async_unload_platforms(
-        config_entry, PLATFORMS
-    )
+    return await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
+
 
-    # Unload services
-    if unload_ok:
-        hass.services.async_remove(DOMAIN, SERVICE_REFRESH)
+async def async_remove_entry(
+    hass: HomeAssistant, config_entry: BoPiConfigEntry
+) -> None:
+    """Remove the data stored for a config entry.
 
-    return unload_ok
+    Args:
+    ----
+        hass: Home Assistant instance.
+        config_entry: Config entry being removed.
+
+    """
+    await snapshot_store(hass, config_entry.entry_id).async_remove()
@@ -0,0 +1,94 @@
+"""Adaptive poll interval for the BoPi integration.
+
+Polls slower while readings are flat, faster while they move, and backs off
+exponentially while the controller keeps failing.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import timedelta
+
+from .const import (
+    ADAPTIVE_CHANGE_THRESHOLDS,
+    ADAPTIVE_SLOWDOWN_FACTOR,
+    ADAPTIVE_SPEEDUP_FACTOR,
+)
+
+
+class AdaptivePollInterval:
+    """Compute the next poll interval from the evolution of the readings."""
+
+    def __init__(self, base: float, floor: float, ceiling: float) -> None:
+        """Initialize the adaptive interval.
+
+        Args:
+        ----
+            base: Configured scan interval in seconds, used as starting point.
+            floor: Fastest allowed interval in seconds.
+            ceiling: Slowest allowed interval in seconds.
+
+        """
+        self.floor = floor
+        self.ceiling = max(ceiling, floor)
+        self.base = min(max(base, self.floor), self.ceiling)
+        self.current = self.base
+        self.failures = 0
+        self._previous: dict[str, float] = {}
+
+    @property
+    def interval(self) -> timedelta:
+        """Return the current interval."""
+        return timedelta(seconds=self.current)
+
+    def record_success(self, readings: Mapping[str, float | None]) -> timedelta:
+        """Adapt the interval after a successful poll.
+
+        Args:
+        ----
+            readings: Latest values of the watched sensors.
+
+        Returns:
+        -------
+            Interval to wait before the next poll.
+
+        """
+        if self.failures:
+            self.failures = 0
+            self.current = self.base
+        elif self._previous:
+            if self._has_moved(readings):
+                self.current = max(self.floor, self.current * ADAPTIVE_SPEEDUP_FACTOR)
+            else:
+                self.current = min(
+                    self.ceiling, self.current * ADAPTIVE_SLOWDOWN_FACTOR
+                )
+
+        self._previous = {
+            key: value for key, value in readings.items() if value is not None
+        }
+        return self.interval
+
+    def record_failure(self) -> timedelta:
+        """Back off exponentially after a failed poll.
+
+        Returns
+        -------
+            Interval to wait before the next poll.
+
+        """
+        self.failures += 1
+        self.current = min(self.ceiling, self.base * 2**self.failures)
+        return self.interval
+
+    def _has_moved(self, readings: Mapping[str, float | None]) -> bool:
+        """Return True if any watched reading moved beyond its threshold."""
+        for key, value in readings.items():
+            previous = self._previous.get(key)
+            if (value is None) != (previous is None):
+                return True
+            if value is None or previous is None:
+                continue
+            if abs(value - previous) >= ADAPTIVE_CHANGE_THRESHOLDS.get(key, 0):
+                return True
+        return False
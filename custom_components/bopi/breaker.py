@@ -0,0 +1,94 @@
+"""Circuit breaker for the BoPi integration.
+
+Stops polling a controller at full cost once it keeps failing, and probes it
+with growing backoff until it answers again.
+"""
+
+from __future__ import annotations
+
+from enum import StrEnum
+from time import monotonic
+
+from .const import (
+    BREAKER_BASE_BACKOFF,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_BACKOFF,
+)
+
+
+class BreakerState(StrEnum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:  # pylint: disable=too-many-instance-attributes
+    """Circuit breaker guarding the polls of one controller."""
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        base_backoff: float = BREAKER_BASE_BACKOFF,
+        max_backoff: float = BREAKER_MAX_BACKOFF,
+    ) -> None:
+        """Initialize the circuit breaker.
+
+        Args:
+        ----
+            failure_threshold: Consecutive failures that open the circuit.
+            base_backoff: Seconds to wait before the first probe.
+            max_backoff: Maximum seconds to wait between probes.
+
+        """
+        self.failure_threshold = failure_threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.probes = 0
+        self.short_circuits = 0
+        self._backoff = base_backoff
+        self._open_until = 0.0
+
+    @property
+    def retry_in(self) -> float:
+        """Return the seconds left before the next probe."""
+        return max(0.0, self._open_until - monotonic())
+
+    def allow_request(self) -> bool:
+        """Return True if the controller may be contacted.
+
+        An open circuit turns half-open once its backoff has elapsed, so the
+        next request acts as a probe.
+        """
+        if self.state is BreakerState.OPEN:
+            if monotonic() < self._open_until:
+                self.short_circuits += 1
+                return False
+            self.state = BreakerState.HALF_OPEN
+            self.probes += 1
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful request."""
+        self.state = BreakerState.CLOSED
+        self.consecutive_failures = 0
+        self._backoff = self.base_backoff
+
+    def record_failure(self) -> None:
+        """Count a failed request and open the circuit when needed."""
+        self.consecutive_failures += 1
+
+        if self.state is BreakerState.HALF_OPEN:
+            self._backoff = min(self.max_backoff, self._backoff * 2)
+        elif self.consecutive_failures >= self.failure_threshold:
+            self.trips += 1
+            self._backoff = self.base_backoff
+        else:
+            return
+
+        self.state = BreakerState.OPEN
+        self._open_until = monotonic() + self._backoff
@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from ipaddress import ip_network
 from typing import Any
 
 from meetbopi import BoPiClient, BoPiConfigError, BoPiConnectionError, BoPiTimeoutError
 import voluptuous as vol
 
 from homeassistant.config_entries import (
+    ConfigEntryState,
     ConfigFlow,
     ConfigFlowResult,
     ConfigEntry,
@@ -17,8 +20,50 @@ from homeassistant.config_entries import (
 from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL, CONF_TIMEOUT
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import (
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN, MIN_SCAN_INTERVAL
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_DEADBANDS,
+    CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+    CONF_EXPORT_FORMAT,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_PUBLISH_MAX_AGE,
+    CONF_ROLLING_STATISTICS,
+    CONF_SENSORS,
+    CONF_SUBNET,
+    CONF_SWITCHES,
+    CONF_UPTIME_AS_BOOT_TIME,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DEADBAND,
+    DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL,
+    DEFAULT_EXPORT_FORMAT,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_PUBLISH_MAX_AGE,
+    DEFAULT_ROLLING_STATISTICS,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_TIMEOUT,
+    DEFAULT_UPTIME_AS_BOOT_TIME,
+    DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+    EXPORT_FILES,
+    MIN_ADAPTIVE_POLL_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    SENSOR_KEYS,
+    SWITCH_KEYS,
+)
+from .discovery import async_discover_controllers
+from .entity import async_migrate_host
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,17 +75,30 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
         ): str,
         vol.Required(
             CONF_PORT,
-            description={"suggested_value": 80},
-            default=80,
+            description={"suggested_value": DEFAULT_PORT},
+            default=DEFAULT_PORT,
         ): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
         vol.Optional(
             CONF_TIMEOUT,
-            description={"suggested_value": 30},
-            default=30,
+            description={"suggested_value": DEFAULT_TIMEOUT},
+            default=DEFAULT_TIMEOUT,
         ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
     }
 )
 
+STEP_SCAN_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(
+            CONF_SUBNET,
+            description={"suggested_value": "192.168.1.0/24"},
+        ): str,
+        vol.Required(
+            CONF_PORT,
+            default=DEFAULT_PORT,
+        ): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+    }
+)
+
 RECONFIGURE_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
@@ -50,17 +108,17 @@ RECONFIGURE_DATA_SCHEMA = vol.Schema(
 )
 
 
-async def validate_input(
-    hass: HomeAssistant,  # pylint: disable=unused-argument
-    data: dict[str, Any],
-) -> dict[str, Any]:
+async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect.
 
     Data has the keys from STEP_USER_DATA_SCHEMA with values provided by the user.
     """
     try:
         bopi_client = BoPiClient(
-            data[CONF_HOST], port=data[CONF_PORT], timeout=data[CONF_TIMEOUT]
+            data[CONF_HOST],
+            port=data[CONF_PORT],
+            timeout=data[CONF_TIMEOUT],
+            session=async_get_clientsession(hass),
         )
     except BoPiConfigError as err:
         # Map field to specific error key for form display
@@ -79,7 +137,49 @@ async def validate_input(
     except BoPiConnectionError as err:
         raise CannotConnect from err
 
-    return {"title": f"BoPi ({data[CONF_HOST]})"}
+    return {"title": entry_title(data[CONF_HOST])}
+
+
+async def async_check_input(
+    hass: HomeAssistant, data: dict[str, Any]
+) -> tuple[dict[str, Any], dict[str, str]]:
+    """Validate the user input and classify the failure, if any.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        data: Host, port and timeout of the controller.
+
+    Returns:
+    -------
+        Info of the validated controller, and the error key of each failing
+        field (``base`` for errors not tied to a field).
+
+    """
+    errors: dict[str, str] = {}
+    try:
+        return await validate_input(hass, data), errors
+    except InvalidHost:
+        errors[CONF_HOST] = "invalid_host"
+    except InvalidPort:
+        errors[CONF_PORT] = "invalid_port"
+    except InvalidTimeout:
+        errors[CONF_TIMEOUT] = "invalid_timeout"
+    except InvalidConfig:
+        errors["base"] = "invalid_config"
+    except CannotConnect:
+        errors["base"] = "cannot_connect"
+    except ConnectionTimeout:
+        errors["base"] = "connection_timeout"
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.exception("Unexpected exception")
+        errors["base"] = "unknown"
+    return {}, errors
+
+
+def entry_title(host: str) -> str:
+    """Return the title, also used as unique ID, of a controller's entry."""
+    return f"BoPi ({host})"
 
 
 class BoPiConfigFlow(ConfigFlow, domain=DOMAIN):  # pylint: disable=abstract-method
@@ -91,6 +191,12 @@ class BoPiConfigFlow(ConfigFlow, domain=DOMAIN):  # pylint: disable=abstract-met
     VERSION = 1
     MINOR_VERSION = 1
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._scan_task: asyncio.Task[list[str]] | None = None
+        self._scan_port = DEFAULT_PORT
+        self._discovered_hosts: list[str] = []
+
     @staticmethod
     @callback
     def async_get_options_flow(config_entry: ConfigEntry) -> BoPiOptionsFlowHandler:
@@ -98,43 +204,138 @@ class BoPiConfigFlow(ConfigFlow, domain=DOMAIN):  # pylint: disable=abstract-met
         return BoPiOptionsFlowHandler()
 
     async def async_step_user(
-        self, user_input: dict[str, Any] | None = None
+        self,
+        user_input: dict[str, Any] | None = None,  # pylint: disable=unused-argument
     ) -> ConfigFlowResult:
         """Handle the initial step."""
-        errors: dict[str, str] = {}
+        return self.async_show_menu(step_id="user", menu_options=["manual", "scan"])
 
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle manual entry of the connection details."""
         if user_input is None:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+                step_id="manual", data_schema=STEP_USER_DATA_SCHEMA
             )
 
-        try:
-            info = await validate_input(self.hass, user_input)
-        except InvalidHost:
-            errors[CONF_HOST] = "invalid_host"
-        except InvalidPort:
-            errors[CONF_PORT] = "invalid_port"
-        except InvalidTimeout:
-            errors[CONF_TIMEOUT] = "invalid_timeout"
-        except InvalidConfig:
-            errors["base"] = "invalid_config"
-        except CannotConnect:
-            errors["base"] = "cannot_connect"
-        except ConnectionTimeout:
-            errors["base"] = "connection_timeout"
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception("Unexpected exception")
-            errors["base"] = "unknown"
+        info, errors = await async_check_input(self.hass, user_input)
 
         if errors:
             return self.async_show_form(
-                step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+                step_id="manual", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
             )
 
         await self.async_set_unique_id(info.get("title"))
         self._abort_if_unique_id_configured()
         return self.async_create_entry(title=info["title"], data=user_input)
 
+    async def async_step_import(self, import_data: dict[str, Any]) -> ConfigFlowResult:
+        """Create an entry for a controller of the import_devices service.
+
+        Aborts with the error key of the validation failure, which the
+        service reports for the controller.
+        """
+        await self.async_set_unique_id(entry_title(import_data[CONF_HOST]))
+        self._abort_if_unique_id_configured()
+
+        info, errors = await async_check_input(self.hass, import_data)
+        if errors:
+            return self.async_abort(reason=next(iter(errors.values())))
+
+        return self.async_create_entry(title=info["title"], data=import_data)
+
+    async def async_step_scan(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Ask for the subnet to scan for controllers."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            try:
+                network = ip_network(user_input[CONF_SUBNET], strict=False)
+            except ValueError:
+                errors[CONF_SUBNET] = "invalid_subnet"
+            else:
+                if network.num_addresses > DISCOVERY_MAX_HOSTS:
+                    errors[CONF_SUBNET] = "subnet_too_large"
+
+            if not errors:
+                self._scan_port = user_input[CONF_PORT]
+                configured = {
+                    entry.data[CONF_HOST]
+                    for entry in self._async_current_entries(include_ignore=False)
+                }
+                self._scan_task = self.hass.async_create_task(
+                    async_discover_controllers(
+                        self.hass, network, self._scan_port, configured
+                    )
+                )
+                return await self.async_step_scan_progress()
+
+        return self.async_show_form(
+            step_id="scan",
+            data_schema=self.add_suggested_values_to_schema(
+                STEP_SCAN_DATA_SCHEMA, user_input
+            ),
+            errors=errors,
+            description_placeholders={"max_hosts": str(DISCOVERY_MAX_HOSTS)},
+        )
+
+    async def async_step_scan_progress(
+        self,
+        user_input: dict[str, Any] | None = None,  # pylint: disable=unused-argument
+    ) -> ConfigFlowResult:
+        """Wait for the subnet scan to finish."""
+        if self._scan_task is None:
+            return self.async_abort(reason="no_devices_found")
+
+        if not self._scan_task.done():
+            return self.async_show_progress(
+                step_id="scan_progress",
+                progress_action="scan",
+                progress_task=self._scan_task,
+            )
+
+        self._discovered_hosts = self._scan_task.result()
+        self._scan_task = None
+        return self.async_show_progress_done(next_step_id="pick")
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Let the user pick one of the controllers found by the scan."""
+        if not self._discovered_hosts:
+            return self.async_abort(reason="no_devices_found")
+
+        if user_input is not None:
+            host = user_input[CONF_HOST]
+            await self.async_set_unique_id(entry_title(host))
+            self._abort_if_unique_id_configured()
+            return self.async_create_entry(
+                title=entry_title(host),
+                data={
+                    CONF_HOST: host,
+                    CONF_PORT: self._scan_port,
+                    CONF_TIMEOUT: DEFAULT_TIMEOUT,
+                },
+            )
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(CONF_HOST): SelectSelector(
+                        SelectSelectorConfig(
+                            options=self._discovered_hosts,
+                            mode=SelectSelectorMode.LIST,
+                        )
+                    )
+                }
+            ),
+            description_placeholders={"count": str(len(self._discovered_hosts))},
+        )
+
     async def async_step_reconfigure(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -166,24 +367,8 @@ class BoPiConfigFlow(ConfigFlow, domain=DOMAIN):  # pylint: disable=abstract-met
                 errors=errors,
             )
 
-        try:
-            reconfigure_data = {**config_entry.data, **user_input}
-            await validate_input(self.hass, reconfigure_data)
-        except InvalidHost:
-            errors[CONF_HOST] = "invalid_host"
-        except InvalidPort:
-            errors[CONF_PORT] = "invalid_port"
-        except InvalidTimeout:
-            errors[CONF_TIMEOUT] = "invalid_timeout"
-        except InvalidConfig:
-            errors["base"] = "invalid_config"
-        except CannotConnect:
-            errors["base"] = "cannot_connect"
-        except ConnectionTimeout:
-            errors["base"] = "connection_timeout"
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception("Unexpected exception")
-            errors["base"] = "unknown"
+        reconfigure_data = {**config_entry.data, **user_input}
+        _, errors = await async_check_input(self.hass, reconfigure_data)
 
         if errors:
             return self.async_show_form(
@@ -204,10 +389,56 @@ class BoPiConfigFlow(ConfigFlow, domain=DOMAIN):  # pylint: disable=abstract-met
                 errors=errors,
             )
 
-        return self.async_update_reload_and_abort(
+        old_host = config_entry.data[CONF_HOST]
+        new_host = reconfigure_data[CONF_HOST]
+        if new_host == old_host:
+            return self._async_update_reconfigured_entry(
+                config_entry, data=reconfigure_data
+            )
+
+        await self.async_set_unique_id(entry_title(new_host))
+        self._abort_if_unique_id_configured()
+        # Entities are keyed by host; move them before the entry is set up
+        # again, or its platforms would remove them as unused
+        async_migrate_host(self.hass, config_entry, old_host, new_host)
+        # Keep a title the user renamed
+        title = (
+            entry_title(new_host)
+            if config_entry.title == entry_title(old_host)
+            else config_entry.title
+        )
+        return self._async_update_reconfigured_entry(
             config_entry,
+            unique_id=entry_title(new_host),
+            title=title,
             data=reconfigure_data,
-            reason="reconfigure_successful",
+        )
+
+    @callback
+    def _async_update_reconfigured_entry(
+        self, config_entry: ConfigEntry, **changes: Any
+    ) -> ConfigFlowResult:
+        """Update a reconfigured entry and finish the flow.
+
+        A loaded entry applies the new settings in place; any other entry,
+        e.g. retrying its setup, is reloaded to use them.
+
+        Args:
+        ----
+            config_entry: Config entry being reconfigured.
+            **changes: Unique ID, title and data of the entry to update.
+
+        Returns:
+        -------
+            Abort result of the flow.
+
+        """
+        if config_entry.state is ConfigEntryState.LOADED:
+            return self.async_update_and_abort(
+                config_entry, reason="reconfigure_successful", **changes
+            )
+        return self.async_update_reload_and_abort(
+            config_entry, reason="reconfigure_successful", **changes
         )
 
 
@@ -226,14 +457,100 @@ class BoPiOptionsFlowHandler(OptionsFlow):
 
         # Prepopulate options fields with default values if available.
         # These are the same default values used on the coordinator.
+        options = self.config_entry.options
         data_schema = vol.Schema(
             {
                 vol.Required(
                     CONF_SCAN_INTERVAL,
-                    default=self.config_entry.options.get(
-                        CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+                    default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                ): (vol.All(vol.Coerce(int), vol.Clamp(min=MIN_SCAN_INTERVAL))),
+                vol.Required(
+                    CONF_ADAPTIVE_POLLING,
+                    default=options.get(
+                        CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING
+                    ),
+                ): bool,
+                vol.Required(
+                    CONF_MIN_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL
+                    ),
+                ): (
+                    vol.All(vol.Coerce(int), vol.Clamp(min=MIN_ADAPTIVE_POLL_INTERVAL))
+                ),
+                vol.Required(
+                    CONF_MAX_POLL_INTERVAL,
+                    default=options.get(
+                        CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
                     ),
                 ): (vol.All(vol.Coerce(int), vol.Clamp(min=MIN_SCAN_INTERVAL))),
+                **{
+                    vol.Required(
+                        option, default=options.get(option, DEFAULT_DEADBAND)
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0))
+                    for option in CONF_DEADBANDS.values()
+                },
+                vol.Required(
+                    CONF_PUBLISH_MAX_AGE,
+                    default=options.get(CONF_PUBLISH_MAX_AGE, DEFAULT_PUBLISH_MAX_AGE),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Required(
+                    CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+                    default=options.get(
+                        CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+                        DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL,
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                vol.Required(
+                    CONF_UPTIME_AS_BOOT_TIME,
+                    default=options.get(
+                        CONF_UPTIME_AS_BOOT_TIME, DEFAULT_UPTIME_AS_BOOT_TIME
+                    ),
+                ): bool,
+                vol.Required(
+                    CONF_SENSORS,
+                    default=list(options.get(CONF_SENSORS, SENSOR_KEYS)),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=list(SENSOR_KEYS),
+                        multiple=True,
+                        mode=SelectSelectorMode.LIST,
+                        translation_key=CONF_SENSORS,
+                    )
+                ),
+                vol.Required(
+                    CONF_SWITCHES,
+                    default=list(options.get(CONF_SWITCHES, SWITCH_KEYS)),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=list(SWITCH_KEYS),
+                        multiple=True,
+                        mode=SelectSelectorMode.LIST,
+                        translation_key=CONF_SWITCHES,
+                    )
+                ),
+                vol.Required(
+                    CONF_ROLLING_STATISTICS,
+                    default=options.get(
+                        CONF_ROLLING_STATISTICS, DEFAULT_ROLLING_STATISTICS
+                    ),
+                ): bool,
+                vol.Required(
+                    CONF_EXPORT_FORMAT,
+                    default=options.get(CONF_EXPORT_FORMAT, DEFAULT_EXPORT_FORMAT),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[DEFAULT_EXPORT_FORMAT, *EXPORT_FILES],
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=CONF_EXPORT_FORMAT,
+                    )
+                ),
+                vol.Required(
+                    CONF_LONG_TERM_STATISTICS,
+                    default=options.get(
+                        CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+                    ),
+                ): bool,
             }
         )
 
@@ -4,5 +4,174 @@ DOMAIN = "bopi"
 
 DEFAULT_SCAN_INTERVAL = 60
 MIN_SCAN_INTERVAL = 60
+DEFAULT_PORT = 80
+DEFAULT_TIMEOUT = 30
+
+CONF_SUBNET = "subnet"
+
+CONF_ADAPTIVE_POLLING = "adaptive_polling"
+CONF_MIN_POLL_INTERVAL = "min_poll_interval"
+CONF_MAX_POLL_INTERVAL = "max_poll_interval"
+
+CONF_UPTIME_AS_BOOT_TIME = "uptime_as_boot_time"
+CONF_SENSORS = "sensors"
+CONF_SWITCHES = "switches"
+CONF_DEADBAND_TEMP1 = "deadband_temp1"
+CONF_DEADBAND_TEMP2 = "deadband_temp2"
+CONF_DEADBAND_PHVALUE = "deadband_phvalue"
+CONF_DEADBAND_REDOXVALUE = "deadband_redoxvalue"
+CONF_PUBLISH_MAX_AGE = "publish_max_age"
+CONF_DIAGNOSTIC_PUBLISH_INTERVAL = "diagnostic_publish_interval"
+CONF_ROLLING_STATISTICS = "rolling_statistics"
+CONF_EXPORT_FORMAT = "export_format"
+CONF_LONG_TERM_STATISTICS = "long_term_statistics"
+
+# Adaptive polling may go below the scan interval while readings move, or it
+# could only ever slow down from the default scan interval
+MIN_ADAPTIVE_POLL_INTERVAL = 15
+
+DEFAULT_ADAPTIVE_POLLING = False
+DEFAULT_MIN_POLL_INTERVAL = 30
+DEFAULT_MAX_POLL_INTERVAL = 600
+DEFAULT_UPTIME_AS_BOOT_TIME = False
+DEFAULT_DEADBAND = 0.0
+DEFAULT_PUBLISH_MAX_AGE = 900
+DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL = 0
+DEFAULT_ROLLING_STATISTICS = False
+DEFAULT_EXPORT_FORMAT = "off"
+DEFAULT_LONG_TERM_STATISTICS = False
+
+# Entities that can be selected in the options, all exist by default
+SENSOR_KEYS = (
+    "temp1",
+    "temp2",
+    "boxtemp",
+    "boxhumidity",
+    "phvalue",
+    "redoxvalue",
+    "uptime",
+)
+SWITCH_KEYS = (
+    "pool_pump",
+    "pool_lights",
+    "relay1",
+    "relay2",
+    "relay3",
+    "relay4",
+)
+
+# Deadband option of each noisy sensor
+CONF_DEADBANDS: dict[str, str] = {
+    "temp1": CONF_DEADBAND_TEMP1,
+    "temp2": CONF_DEADBAND_TEMP2,
+    "phvalue": CONF_DEADBAND_PHVALUE,
+    "redoxvalue": CONF_DEADBAND_REDOXVALUE,
+}
+
+# Change of each diagnostic sensor published at once when diagnostics are
+# published at a slower rate, uptime is only published on time
+DIAGNOSTIC_PUBLISH_THRESHOLDS: dict[str, float] = {
+    "boxtemp": 1.0,
+    "boxhumidity": 5,
+    "uptime": float("inf"),
+}
+
+# Readings reported by the controller when a probe is disconnected
+SENSOR_SENTINELS: dict[str, tuple[float, ...]] = {
+    "temp1": (-127,),
+    "temp2": (-127,),
+    "boxtemp": (-127,),
+    "phvalue": (-127,),
+    "redoxvalue": (-127,),
+}
+
+# Options changing which entities exist, the entry is reloaded when they change
+ENTITY_OPTIONS = (
+    CONF_SENSORS,
+    CONF_SWITCHES,
+    CONF_UPTIME_AS_BOOT_TIME,
+    CONF_ROLLING_STATISTICS,
+)
+
+# Sensors with rolling statistics, and the length of each window in seconds
+ROLLING_SENSORS = ("temp1", "temp2", "phvalue", "redoxvalue")
+ROLLING_WINDOWS: dict[str, int] = {"1h": 3600, "24h": 86400}
+ROLLING_STATISTICS = ("min", "max", "mean")
+ROLLING_PRECISION = 3
+
+# Export of every reading to an append-only file, bypassing the recorder:
+# file of each format, samples per write, seconds between writes of a partial
+# batch, and samples kept in memory before the oldest ones are dropped
+EXPORT_FILES: dict[str, str] = {
+    "line_protocol": "bopi_export.lp",
+    "csv": "bopi_export.csv",
+}
+EXPORT_BATCH_SIZE = 500
+EXPORT_FLUSH_INTERVAL = 30
+EXPORT_MAX_QUEUE = 10000
+
+# Sensors aggregated into hourly external statistics by the coordinator
+LONG_TERM_SENSORS = ("temp1", "phvalue", "redoxvalue")
+
+# Movement (in sensor units) that makes adaptive polling speed up
+ADAPTIVE_CHANGE_THRESHOLDS: dict[str, float] = {
+    "temp1": 0.2,
+    "temp2": 0.2,
+    "phvalue": 0.05,
+    "redoxvalue": 10,
+}
+ADAPTIVE_SPEEDUP_FACTOR = 0.5
+ADAPTIVE_SLOWDOWN_FACTOR = 1.5
+
+# Maximum number of controllers polled at the same time across all entries
+MAX_CONCURRENT_POLLS = 10
+
+# Circuit breaker around the polls of each controller
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_BASE_BACKOFF = 60
+BREAKER_MAX_BACKOFF = 3600
+BREAKER_PROBE_TIMEOUT = 5
+
+# Subnet scan of the config flow: largest subnet, probes in flight and
+# seconds to wait for each address
+DISCOVERY_MAX_HOSTS = 1024
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_TIMEOUT = 2
+
+# Controllers validated at once by the import_devices service
+IMPORT_CONCURRENCY = 32
+
+# Boot time shifts smaller than this are clock drift, not a reboot
+BOOT_TIME_TOLERANCE = 120
+
+# Upper bounds, in seconds, of the poll latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Persisted last-known snapshot of each controller, written 15 minutes after
+# the first poll since the previous write, and on unload and on stop
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 900
+
+# Limits of the temporary high-frequency sampling of the sample_burst service
+BURST_MIN_INTERVAL = 5
+BURST_MAX_INTERVAL = MIN_SCAN_INTERVAL
+BURST_MAX_DURATION = 3600
+DEFAULT_BURST_INTERVAL = 10
+DEFAULT_BURST_DURATION = 300
+
+# Poll cycles profiled per device by the profile service
+PROFILE_MAX_CYCLES = 100
+DEFAULT_PROFILE_CYCLES = 5
+
+ATTR_STALE = "stale"
+ATTR_INTERVAL = "interval"
+ATTR_DURATION = "duration"
+ATTR_REFRESH = "refresh"
+ATTR_DEVICES = "devices"
+ATTR_CYCLES = "cycles"
 
 SERVICE_REFRESH = "refresh"
+SERVICE_SAMPLE_BURST = "sample_burst"
+SERVICE_GET_SNAPSHOT = "get_snapshot"
+SERVICE_IMPORT_DEVICES = "import_devices"
+SERVICE_PROFILE = "profile"
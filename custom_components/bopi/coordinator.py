@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import timedelta
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime, timedelta
+from functools import cache, partial
+from operator import attrgetter
+from time import monotonic
 from typing import Any
 
 from meetbopi import BoPiClient
 from meetbopi.exceptions import (
     BoPiConnectionError,
+    BoPiError,
     BoPiTimeoutError,
-    BoPiValidationError,
 )
+from meetbopi.relay import PoolLights, PoolPump, Relay
+from meetbopi.sensors_state import SensorsState
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -20,18 +28,133 @@ from homeassistant.const import (
     CONF_SCAN_INTERVAL,
     CONF_TIMEOUT,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .adaptive import AdaptivePollInterval
+from .breaker import BreakerState, CircuitBreaker
+from .const import (
+    ADAPTIVE_CHANGE_THRESHOLDS,
+    BOOT_TIME_TOLERANCE,
+    BREAKER_PROBE_TIMEOUT,
+    CONF_ADAPTIVE_POLLING,
+    CONF_DEADBANDS,
+    CONF_DIAGNOSTIC_PUBLISH_INTERVAL,
+    CONF_EXPORT_FORMAT,
+    CONF_LONG_TERM_STATISTICS,
+    CONF_MAX_POLL_INTERVAL,
+    CONF_MIN_POLL_INTERVAL,
+    CONF_PUBLISH_MAX_AGE,
+    CONF_ROLLING_STATISTICS,
+    CONF_SENSORS,
+    CONF_SWITCHES,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DEADBAND,
+    DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL,
+    DEFAULT_EXPORT_FORMAT,
+    DEFAULT_LONG_TERM_STATISTICS,
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_PUBLISH_MAX_AGE,
+    DEFAULT_ROLLING_STATISTICS,
+    DEFAULT_SCAN_INTERVAL,
+    DIAGNOSTIC_PUBLISH_THRESHOLDS,
+    DOMAIN,
+    EXPORT_FILES,
+    LONG_TERM_SENSORS,
+    MIN_SCAN_INTERVAL,
+    ROLLING_PRECISION,
+    ROLLING_SENSORS,
+    ROLLING_STATISTICS,
+    ROLLING_WINDOWS,
+    SENSOR_KEYS,
+    SWITCH_KEYS,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+)
+from .export import (
+    BoPiExportSink,
+    ExportSample,
+    async_acquire_export_sink,
+    async_release_export_sink,
+)
+from .filters import PublishRule, SampleFilter, disconnected_sensors, mask_sentinels
+from .longterm import BoPiLongTermStatistics
+from .metrics import PollMetrics
+from .profiler import BoPiProfileSession
+from .rolling import RollingWindow
+from .scheduler import async_get_scheduler
 
 _LOGGER = logging.getLogger(__name__)
 
+# Listener context of diagnostic entities, updated after every refresh
+DIAGNOSTICS_CONTEXT = "diagnostics"
+# Listener context of the boot time sensor
+BOOT_TIME_CONTEXT = "boot_time"
+
+
+@cache
+def value_accessor(path: str) -> Callable[[SensorsState], Any]:
+    """Compile a dotted data path of a sensors state into an accessor.
+
+    Args:
+    ----
+        path: Dotted attribute path, e.g. "relay1.status".
+
+    Returns:
+    -------
+        Callable returning the value at the path, or None if it is missing.
+
+    """
+    getter = attrgetter(path)
+
+    def _get_value(sensors_state: SensorsState) -> Any:
+        try:
+            return getter(sensors_state)
+        except AttributeError:
+            return None
+
+    return _get_value
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the last known snapshot of a config entry.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        entry_id: Config entry identifier.
+
+    Returns:
+    -------
+        Store for the snapshot of the config entry.
+
+    """
+    return Store(hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
 
-class BoPiCoordinator(DataUpdateCoordinator[dict[str, Any]]):
+
+def _sensors_state_from_dict(data: dict[str, Any]) -> SensorsState:
+    """Rebuild a sensors state from its stored representation."""
+    return SensorsState(
+        **{
+            **data,
+            "pool_pump": PoolPump(**data["pool_pump"]),
+            "pool_lights": PoolLights(**data["pool_lights"]),
+            **{
+                relay: Relay(**data[relay])
+                for relay in ("relay1", "relay2", "relay3", "relay4")
+            },
+        }
+    )
+
+
+class BoPiCoordinator(DataUpdateCoordinator[dict[str, Any]]):  # pylint: disable=too-many-instance-attributes
     """Coordinator for BoPi integration."""
 
     data: dict[str, Any]
@@ -49,6 +172,32 @@ class BoPiCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         self.port = config_entry.data[CONF_PORT]
         self.timeout = config_entry.data[CONF_TIMEOUT]
         self._config_entry: ConfigEntry = config_entry
+        self._changed_paths: set[str] | None = None
+        self._store = snapshot_store(hass, config_entry.entry_id)
+        # A delayed save of the snapshot is scheduled and not written yet
+        self._snapshot_save_pending = False
+        self.dispatched_updates = 0
+        self.skipped_updates = 0
+        # Sensors and switches with an entity, other fields are left alone
+        self.sensors = frozenset(config_entry.options.get(CONF_SENSORS, SENSOR_KEYS))
+        self.switches = frozenset(config_entry.options.get(CONF_SWITCHES, SWITCH_KEYS))
+        self.breaker = CircuitBreaker()
+        self.metrics = PollMetrics()
+        self._adaptive = self._build_adaptive_interval()
+        self._filter = self._build_sample_filter()
+        self._rolling = self._build_rolling_windows()
+        self._burst_interval: timedelta | None = None
+        self._burst_until = 0.0
+        self._refresh_task: asyncio.Task[None] | None = None
+        # Profile session of the bopi.profile service, None while not profiled
+        self.profile: BoPiProfileSession | None = None
+        self._scheduler = async_get_scheduler(hass)
+        self._phase_offset: timedelta | None = self._scheduler.phase_offset(
+            config_entry.entry_id, self._get_update_interval()
+        )
+        config_entry.async_on_unload(
+            partial(self._scheduler.unregister, config_entry.entry_id)
+        )
 
         super().__init__(
             hass,
@@ -58,7 +207,10 @@ class BoPiCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=self._get_update_interval(),
         )
 
-        self.api = BoPiClient(self.host, port=self.port, timeout=self.timeout)
+        self.api = self._build_client()
+        # Shared sink of the export format, None while export is disabled
+        self.export = self._acquire_export_sink()
+        self.long_term = self._build_long_term_statistics()
 
     def _get_update_interval(self) -> timedelta:
         """Get the current update interval from config entry options.
@@ -68,11 +220,258 @@ class BoPiCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             Update interval as timedelta.
 
         """
+        if self._adaptive is not None:
+            return self._adaptive.interval
+
         poll_interval = self._config_entry.options.get(
             CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
         )
         return timedelta(seconds=poll_interval)
 
+    def _build_adaptive_interval(self) -> AdaptivePollInterval | None:
+        """Build the adaptive interval from config entry options.
+
+        Returns:
+        -------
+            Adaptive interval, or None when adaptive polling is disabled.
+
+        """
+        options = self._config_entry.options
+        if not options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+            return None
+
+        return AdaptivePollInterval(
+            base=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+            floor=options.get(CONF_MIN_POLL_INTERVAL, DEFAULT_MIN_POLL_INTERVAL),
+            ceiling=options.get(CONF_MAX_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL),
+        )
+
+    def _build_sample_filter(self) -> SampleFilter:
+        """Build the sample filter from config entry options.
+
+        Primary water sensors are held back within their deadband, diagnostic
+        sensors are published at a slower rate unless they cross a threshold.
+
+        Returns:
+        -------
+            Sample filter holding back readings within their deadband.
+
+        """
+        options = self._config_entry.options
+        max_age = options.get(CONF_PUBLISH_MAX_AGE, DEFAULT_PUBLISH_MAX_AGE)
+        rules = {
+            key: PublishRule(deadband=deadband, max_age=max_age)
+            for key, option in CONF_DEADBANDS.items()
+            if key in self.sensors
+            and (deadband := options.get(option, DEFAULT_DEADBAND)) > 0
+        }
+
+        diagnostic_interval = options.get(
+            CONF_DIAGNOSTIC_PUBLISH_INTERVAL, DEFAULT_DIAGNOSTIC_PUBLISH_INTERVAL
+        )
+        if diagnostic_interval > 0:
+            rules |= {
+                key: PublishRule(deadband=threshold, max_age=diagnostic_interval)
+                for key, threshold in DIAGNOSTIC_PUBLISH_THRESHOLDS.items()
+                if key in self.sensors
+            }
+
+        return SampleFilter(rules)
+
+    def _build_rolling_windows(self) -> dict[str, dict[str, RollingWindow]]:
+        """Build the rolling windows from config entry options.
+
+        Returns:
+        -------
+            Rolling window of each sensor and window name, empty when rolling
+            statistics are disabled.
+
+        """
+        if not self._config_entry.options.get(
+            CONF_ROLLING_STATISTICS, DEFAULT_ROLLING_STATISTICS
+        ):
+            return {}
+
+        return {
+            key: {
+                window: RollingWindow.for_interval(seconds, MIN_SCAN_INTERVAL)
+                for window, seconds in ROLLING_WINDOWS.items()
+            }
+            for key in ROLLING_SENSORS
+            if key in self.sensors
+        }
+
+    def _acquire_export_sink(self) -> BoPiExportSink | None:
+        """Acquire the export sink selected in config entry options.
+
+        Returns
+        -------
+            Export sink of the format, or None when export is disabled.
+
+        """
+        export_format = self._config_entry.options.get(
+            CONF_EXPORT_FORMAT, DEFAULT_EXPORT_FORMAT
+        )
+        if export_format not in EXPORT_FILES:
+            return None
+        return async_acquire_export_sink(self.hass, export_format)
+
+    def _build_long_term_statistics(self) -> BoPiLongTermStatistics | None:
+        """Build the long-term statistics from config entry options.
+
+        Returns
+        -------
+            Hourly statistics, or None when they are disabled.
+
+        """
+        if not self._config_entry.options.get(
+            CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+        ):
+            return None
+        return BoPiLongTermStatistics(
+            self.hass, self._config_entry.entry_id, self._config_entry.title
+        )
+
+    def _build_client(self) -> BoPiClient:
+        """Create the client of the controller from the connection settings.
+
+        Returns
+        -------
+            Client using the shared aiohttp session.
+
+        """
+        return BoPiClient(
+            self.host,
+            port=self.port,
+            timeout=self.timeout,
+            session=async_get_clientsession(self.hass),
+        )
+
+    def apply_connection(self) -> bool:
+        """Swap the client after the host, port or timeout changed.
+
+        Entities keep running; the next poll goes to the new address. A poll
+        in flight completes against the previous client.
+
+        Returns
+        -------
+            True if the connection settings changed.
+
+        """
+        data = self._config_entry.data
+        connection = (data[CONF_HOST], data[CONF_PORT], data[CONF_TIMEOUT])
+        if connection == (self.host, self.port, self.timeout):
+            return False
+
+        self.host, self.port, self.timeout = connection
+        self.api = self._build_client()
+        # Failures of the previous address say nothing about the new one
+        self.breaker = CircuitBreaker()
+        return True
+
+    def apply_options(self) -> None:
+        """Apply polling options after the config entry options changed."""
+        self._adaptive = self._build_adaptive_interval()
+        self._filter = self._build_sample_filter()
+        # Acquired before the release, so a sink kept by the options stays open
+        export, self.export = self.export, self._acquire_export_sink()
+        if export is not None:
+            self.hass.async_create_background_task(
+                async_release_export_sink(self.hass, export),
+                f"{DOMAIN} export release",
+            )
+        # The hour in progress survives unless long-term statistics are
+        # disabled; importing it would be replaced if they were enabled again
+        if self.long_term is None:
+            self.long_term = self._build_long_term_statistics()
+        elif not self._config_entry.options.get(
+            CONF_LONG_TERM_STATISTICS, DEFAULT_LONG_TERM_STATISTICS
+        ):
+            self.long_term = None
+        else:
+            self.long_term.title = self._config_entry.title
+        self.update_interval = self._get_update_interval()
+
+    @property
+    def burst_remaining(self) -> float:
+        """Return the seconds left in the current sampling burst."""
+        if self._burst_interval is None:
+            return 0.0
+        return max(0.0, self._burst_until - monotonic())
+
+    async def async_start_burst(self, interval: timedelta, duration: timedelta) -> None:
+        """Poll at a short interval for a limited time.
+
+        The configured interval resumes on its own once the burst is over, or
+        as soon as a poll fails. Starting a burst while one is running only
+        replaces its interval and end, from the next poll on, so repeated calls
+        never poll faster than the burst interval.
+
+        Args:
+        ----
+            interval: Interval between polls during the burst.
+            duration: Length of the burst.
+
+        """
+        bursting = self.burst_remaining > 0
+        self._burst_interval = interval
+        self._burst_until = monotonic() + duration.total_seconds()
+        _LOGGER.debug("Sampling %s every %s for %s", self.name, interval, duration)
+        if not bursting:
+            await self.async_refresh_coalesced()
+
+    async def async_refresh_coalesced(self) -> None:
+        """Refresh data now, joining the refresh already in flight if any.
+
+        Overlapping calls share a single request to the controller.
+        """
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = self._config_entry.async_create_task(
+                self.hass, self.async_refresh(), f"{self.name} refresh"
+            )
+        # Cancelling one caller must not cancel the refresh shared by others
+        await asyncio.shield(self._refresh_task)
+
+    async def _async_refresh(
+        self,
+        log_failures: bool = True,
+        raise_on_auth_failed: bool = False,
+        scheduled: bool = False,
+        raise_on_entry_error: bool = False,
+    ) -> None:
+        """Refresh data, under the profiler while a profile session runs.
+
+        A cycle covers the fetch, the validation of the response and the
+        dispatch to the entities.
+        """
+        if (profile := self.profile) is None:
+            await super()._async_refresh(
+                log_failures, raise_on_auth_failed, scheduled, raise_on_entry_error
+            )
+            return
+
+        profile.cycle_started(self)
+        try:
+            await super()._async_refresh(
+                log_failures, raise_on_auth_failed, scheduled, raise_on_entry_error
+            )
+        finally:
+            profile.cycle_finished(self)
+
+    async def async_shutdown(self) -> None:
+        """Cancel scheduled refreshes, stop profiling and release the export."""
+        await super().async_shutdown()
+        if self.data and not self.data["stale"]:
+            # Replaces the delayed save, the next setup restores from this,
+            # including the hour in progress of the long-term statistics
+            await self._store.async_save(self._snapshot_to_store())
+            self._snapshot_save_pending = False
+        if self.profile is not None:
+            self.profile.release(self)
+        if (export := self.export) is not None:
+            self.export = None
+            await async_release_export_sink(self.hass, export)
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from API endpoint.
 
@@ -84,6 +483,424 @@ class BoPiCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         ------
             UpdateFailed: If data fetch fails.
 
+        """
+        try:
+            raw_state = await self._async_guarded_fetch()
+        except UpdateFailed:
+            self._changed_paths = None
+            self._update_poll_interval(None)
+            raise
+
+        data = self._process_sensors_state(raw_state)
+        self._update_poll_interval(raw_state)
+        return data
+
+    def _process_sensors_state(self, raw_state: SensorsState) -> dict[str, Any]:
+        """Turn a freshly fetched sensors state into coordinator data.
+
+        Args:
+        ----
+            raw_state: Sensors state as reported by the controller.
+
+        Returns:
+        -------
+            Dictionary containing host and sensor state information.
+
+        """
+        fetched_at = dt_util.utcnow()
+        masked_state = mask_sentinels(raw_state)
+        sensors_state = self._filter.apply(masked_state)
+        self._add_rolling_samples(masked_state)
+        self._add_export_sample(masked_state, fetched_at)
+        self._add_long_term_sample(masked_state, fetched_at)
+        derived = {
+            BOOT_TIME_CONTEXT: self._get_boot_time(raw_state, fetched_at),
+            **self._get_rolling_statistics(),
+        }
+        self._changed_paths = self._get_changed_paths(sensors_state, derived)
+        if not self._snapshot_save_pending:
+            # Delayed saves are debounced, so polls must not postpone this one
+            self._snapshot_save_pending = True
+            self._store.async_delay_save(self._snapshot_to_save, SNAPSHOT_SAVE_DELAY)
+
+        return {
+            "host": self.api.host,
+            "sensors_state": sensors_state,
+            "disconnected": disconnected_sensors(sensors_state),
+            "fetched_at": fetched_at,
+            "derived": derived,
+            "stale": False,
+        }
+
+    def _get_boot_time(
+        self, sensors_state: SensorsState, fetched_at: datetime
+    ) -> datetime:
+        """Return when the controller booted, ignoring clock drift.
+
+        Args:
+        ----
+            sensors_state: Newly fetched sensors state.
+            fetched_at: When the sensors state was fetched.
+
+        Returns:
+        -------
+            Boot time of the controller.
+
+        """
+        boot_time = fetched_at - timedelta(seconds=sensors_state.uptime)
+        if (
+            self.data
+            and (previous := self.data["derived"].get(BOOT_TIME_CONTEXT)) is not None
+        ):
+            if abs(boot_time - previous) < timedelta(seconds=BOOT_TIME_TOLERANCE):
+                return previous
+        return boot_time
+
+    def _add_rolling_samples(self, sensors_state: SensorsState) -> None:
+        """Add the readings to the rolling windows.
+
+        Args:
+        ----
+            sensors_state: Sensors state without sentinel readings, before
+                deadband filtering.
+
+        """
+        now = monotonic()
+        for key, windows in self._rolling.items():
+            value = getattr(sensors_state, key)
+            for window in windows.values():
+                if value is None:
+                    window.expire(now)
+                else:
+                    window.add(now, value)
+
+    def _add_export_sample(
+        self, sensors_state: SensorsState, fetched_at: datetime
+    ) -> None:
+        """Queue the readings of the selected sensors for export.
+
+        Args:
+        ----
+            sensors_state: Sensors state without sentinel readings, before
+                deadband filtering.
+            fetched_at: When the sensors state was fetched.
+
+        """
+        if (export := self.export) is None:
+            return
+        values = {
+            key: float(value)
+            for key in SENSOR_KEYS
+            if key in self.sensors
+            and (value := getattr(sensors_state, key, None)) is not None
+        }
+        if values:
+            export.add(ExportSample(fetched_at, self.api.host, values))
+
+    def _add_long_term_sample(
+        self, sensors_state: SensorsState, fetched_at: datetime
+    ) -> None:
+        """Add the readings to the hourly long-term statistics.
+
+        Args:
+        ----
+            sensors_state: Sensors state without sentinel readings, before
+                deadband filtering.
+            fetched_at: When the sensors state was fetched.
+
+        """
+        if (long_term := self.long_term) is None:
+            return
+        long_term.add(
+            fetched_at,
+            {
+                key: float(value)
+                for key in LONG_TERM_SENSORS
+                if key in self.sensors
+                and (value := getattr(sensors_state, key, None)) is not None
+            },
+        )
+
+    def _get_rolling_statistics(self) -> dict[str, float | None]:
+        """Return the statistics of the rolling windows.
+
+        Returns
+        -------
+            Statistics keyed by listener context, e.g. "phvalue_24h_mean".
+
+        """
+        statistics: dict[str, float | None] = {}
+
+        for key, windows in self._rolling.items():
+            for window_name, window in windows.items():
+                for statistic in ROLLING_STATISTICS:
+                    result = getattr(window, statistic)
+                    statistics[f"{key}_{window_name}_{statistic}"] = (
+                        None if result is None else round(result, ROLLING_PRECISION)
+                    )
+
+        return statistics
+
+    async def _async_guarded_fetch(self) -> SensorsState:
+        """Fetch the sensors state through the circuit breaker.
+
+        Returns:
+        -------
+            Latest sensors state reported by the controller.
+
+        Raises:
+        ------
+            UpdateFailed: If the circuit is open or the fetch fails.
+
+        """
+        breaker = self.breaker
+        if not breaker.allow_request():
+            raise UpdateFailed(
+                f"Device unreachable, next probe in {breaker.retry_in:.0f} seconds"
+            )
+
+        async with self._scheduler.slot():
+            start = monotonic()
+            try:
+                if breaker.state is BreakerState.HALF_OPEN:
+                    await self._async_probe()
+                sensors_state = await self._async_fetch_sensors_state()
+            except UpdateFailed as err:
+                breaker.record_failure()
+                self.metrics.record_failure(err.__cause__ or err)
+                raise
+
+        self.metrics.record_success(monotonic() - start)
+        breaker.record_success()
+        return sensors_state
+
+    async def _async_probe(self) -> None:
+        """Check that the controller accepts connections again.
+
+        Raises
+        ------
+            UpdateFailed: If the controller does not accept the connection.
+
+        """
+        try:
+            async with asyncio.timeout(BREAKER_PROBE_TIMEOUT):
+                _, writer = await asyncio.open_connection(self.api.host, self.api.port)
+                writer.close()
+                await writer.wait_closed()
+        except (OSError, TimeoutError) as err:
+            raise UpdateFailed(f"Device still unreachable: {err}") from err
+
+    async def async_restore_snapshot(self) -> bool:
+        """Publish the last known sensors state, marked as stale.
+
+        Returns
+        -------
+            True if a snapshot was restored.
+
+        """
+        if (stored := await self._store.async_load()) is None:
+            return False
+
+        self._restore_long_term(stored.get("long_term", {}))
+        try:
+            sensors_state = _sensors_state_from_dict(stored["sensors_state"])
+            if (fetched_at := dt_util.parse_datetime(stored["fetched_at"])) is None:
+                raise ValueError("Invalid fetch timestamp")
+        except (KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug("Ignoring unusable snapshot for %s: %s", self.name, err)
+            return False
+
+        self.async_set_updated_data(
+            {
+                "host": self.api.host,
+                "sensors_state": sensors_state,
+                "disconnected": disconnected_sensors(sensors_state),
+                "fetched_at": fetched_at,
+                "derived": {
+                    BOOT_TIME_CONTEXT: self._get_boot_time(sensors_state, fetched_at),
+                    **self._get_rolling_statistics(),
+                },
+                "stale": True,
+            }
+        )
+        return True
+
+    @callback
+    def _restore_long_term(self, stored: dict[str, Any]) -> None:
+        """Restore the hour in progress of the long-term statistics.
+
+        Args:
+        ----
+            stored: Stored buckets of the hour in progress.
+
+        """
+        if (long_term := self.long_term) is None:
+            return
+        try:
+            long_term.restore(stored)
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            _LOGGER.debug(
+                "Ignoring unusable hourly statistics of %s: %s", self.name, err
+            )
+
+    @callback
+    def _snapshot_to_save(self) -> dict[str, Any]:
+        """Return the snapshot for the delayed save, allowing the next one."""
+        self._snapshot_save_pending = False
+        return self._snapshot_to_store()
+
+    @callback
+    def _snapshot_to_store(self) -> dict[str, Any]:
+        """Return the last successful poll in its stored representation."""
+        return {
+            "sensors_state": asdict(self.data["sensors_state"]),
+            "fetched_at": self.data["fetched_at"].isoformat(),
+            "long_term": (self.long_term.buckets_to_store() if self.long_term else {}),
+        }
+
+    @callback
+    def get_snapshot(self) -> dict[str, Any]:
+        """Return the latest published data in a JSON-serializable form.
+
+        Returns
+        -------
+            Sensors state of the controller with its freshness.
+
+        """
+        snapshot: dict[str, Any] = {
+            "entry_id": self._config_entry.entry_id,
+            "title": self._config_entry.title,
+            "host": self.api.host,
+            "available": self.last_update_success,
+            "fetched_at": None,
+            "age": None,
+            "stale": None,
+            "disconnected": [],
+            "sensors_state": None,
+        }
+        if not self.data:
+            return snapshot
+
+        fetched_at = self.data["fetched_at"]
+        return snapshot | {
+            "fetched_at": fetched_at.isoformat(),
+            "age": round((dt_util.utcnow() - fetched_at).total_seconds(), 1),
+            "stale": self.data["stale"],
+            "disconnected": sorted(self.data["disconnected"]),
+            "sensors_state": asdict(self.data["sensors_state"]),
+        }
+
+    def _get_changed_paths(
+        self, sensors_state: SensorsState, derived: dict[str, Any]
+    ) -> set[str] | None:
+        """Return the listener contexts whose value changed since the last poll.
+
+        Args:
+        ----
+            sensors_state: Newly fetched sensors state.
+            derived: Values computed from the readings, keyed by listener
+                context.
+
+        Returns:
+        -------
+            Changed data paths, or None if every listener must be notified.
+
+        """
+        if not self.last_update_success or not self.data or self.data["stale"]:
+            return None
+
+        previous_derived = self.data["derived"]
+        changed_paths = {
+            context
+            for context, value in derived.items()
+            if previous_derived.get(context) != value
+        }
+
+        previous = self.data["sensors_state"]
+        if previous == sensors_state:
+            return changed_paths
+
+        return changed_paths | {
+            path
+            for path in set(self.async_contexts())
+            if path != DIAGNOSTICS_CONTEXT
+            and path not in derived
+            and value_accessor(path)(previous) != value_accessor(path)(sensors_state)
+        }
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners whose value changed since the last poll.
+
+        Listeners without a context, and every listener after a failure or a
+        recovery, are always updated.
+        """
+        changed_paths = self._changed_paths
+        self._changed_paths = None
+
+        start = monotonic()
+        for update_callback, context in list(self._listeners.values()):
+            if context == DIAGNOSTICS_CONTEXT:
+                continue
+            if changed_paths is None or context is None or context in changed_paths:
+                self.dispatched_updates += 1
+                update_callback()
+            else:
+                self.skipped_updates += 1
+        self.metrics.fanout_latency.record(monotonic() - start)
+
+    @callback
+    def _async_refresh_finished(self) -> None:
+        """Update diagnostic listeners after every refresh, failed or not."""
+        for update_callback, context in list(self._listeners.values()):
+            if context == DIAGNOSTICS_CONTEXT:
+                update_callback()
+
+    def _update_poll_interval(self, sensors_state: SensorsState | None) -> None:
+        """Set the interval until the next poll.
+
+        Args:
+        ----
+            sensors_state: Latest sensors state, or None if the poll failed.
+
+        """
+        if self._burst_interval is not None:
+            if sensors_state is not None and self.burst_remaining > 0:
+                self.update_interval = self._burst_interval
+                return
+            _LOGGER.debug("Sampling burst of %s is over", self.name)
+            self._burst_interval = None
+
+        if self._adaptive is None:
+            interval = self._get_update_interval()
+        elif sensors_state is None:
+            interval = self._adaptive.record_failure()
+        else:
+            interval = self._adaptive.record_success(
+                {
+                    key: getattr(sensors_state, key, None)
+                    for key in ADAPTIVE_CHANGE_THRESHOLDS
+                }
+            )
+
+        if self._phase_offset is not None:
+            # Shift the first scheduled poll so entries do not poll in lockstep
+            interval += self._phase_offset
+            self._phase_offset = None
+
+        self.update_interval = interval
+
+    async def _async_fetch_sensors_state(self) -> SensorsState:
+        """Fetch the sensors state from the controller.
+
+        Returns:
+        -------
+            Latest sensors state reported by the controller.
+
+        Raises:
+        ------
+            UpdateFailed: If data fetch fails.
+
         """
         try:
             sensors_state = await self.api.get_sensors_state()
@@ -91,10 +908,9 @@ class BoPiCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             raise UpdateFailed(f"Timeout communicating with API: {err}") from err
         except BoPiConnectionError as err:
             raise UpdateFailed(f"Error connecting to API: {err}") from err
-        except BoPiValidationError as err:
+        except (AttributeError, BoPiError, KeyError, TypeError, ValueError) as err:
+            # Out-of-range values, undecodable JSON, JSON that is not an
+            # object or missing fields
             raise UpdateFailed(f"Invalid API response: {err}") from err
 
-        return {
-            "host": self.api.host,
-            "sensors_state": sensors_state,
-        }
+        return sensors_state
@@ -0,0 +1,80 @@
+"""Diagnostics support for BoPi integration."""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from . import BoPiConfigEntry
+from .scheduler import async_get_scheduler
+
+TO_REDACT = {CONF_HOST, "host"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: BoPiConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        config_entry: Config entry for BoPi integration.
+
+    Returns:
+    -------
+        Diagnostics data of the config entry.
+
+    """
+    coordinator = config_entry.runtime_data.coordinator
+    breaker = coordinator.breaker
+    scheduler = async_get_scheduler(hass)
+    data = coordinator.data or {}
+
+    return {
+        "entry": {
+            "data": async_redact_data(config_entry.data, TO_REDACT),
+            "options": dict(config_entry.options),
+        },
+        "coordinator": {
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval
+            else None,
+            "last_update_success": coordinator.last_update_success,
+            "last_exception": repr(coordinator.last_exception)
+            if coordinator.last_exception
+            else None,
+            "dispatched_updates": coordinator.dispatched_updates,
+            "skipped_updates": coordinator.skipped_updates,
+            "burst_remaining": coordinator.burst_remaining,
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "circuit_breaker": {
+            "state": breaker.state.value,
+            "consecutive_failures": breaker.consecutive_failures,
+            "trips": breaker.trips,
+            "probes": breaker.probes,
+            "short_circuits": breaker.short_circuits,
+            "retry_in": breaker.retry_in,
+        },
+        "scheduler": {
+            "max_concurrent": scheduler.max_concurrent,
+            "in_flight": scheduler.in_flight,
+            "queue_depth": scheduler.queue_depth,
+        },
+        "export": coordinator.export.as_dict() if coordinator.export else None,
+        "long_term_statistics": {
+            "imported_hours": coordinator.long_term.imported_hours,
+        }
+        if coordinator.long_term
+        else None,
+        "data": {
+            "fetched_at": data["fetched_at"].isoformat() if data else None,
+            "stale": data.get("stale"),
+            "sensors_state": asdict(data["sensors_state"]) if data else None,
+        },
+    }
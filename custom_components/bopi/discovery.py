@@ -0,0 +1,72 @@
+"""LAN discovery of BoPi controllers.
+
+Probes every address of a subnet for the BoPi HTTP API with bounded
+concurrency and a short timeout per host.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Collection
+from ipaddress import IPv4Network, IPv6Network
+
+from meetbopi import BoPiClient
+from meetbopi.exceptions import BoPiError
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .const import DISCOVERY_CONCURRENCY, DISCOVERY_TIMEOUT
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def async_discover_controllers(
+    hass: HomeAssistant,
+    network: IPv4Network | IPv6Network,
+    port: int,
+    exclude: Collection[str] = (),
+) -> list[str]:
+    """Return the addresses of a subnet answering like a BoPi controller.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        network: Subnet to scan.
+        port: Port of the BoPi HTTP API.
+        exclude: Addresses that are not probed, e.g. configured controllers.
+
+    Returns:
+    -------
+        Addresses of the BoPi controllers found, in address order.
+
+    """
+    session = async_get_clientsession(hass)
+    semaphore = asyncio.Semaphore(DISCOVERY_CONCURRENCY)
+
+    async def _async_probe(host: str) -> bool:
+        async with semaphore:
+            client = BoPiClient(
+                host, port=port, timeout=DISCOVERY_TIMEOUT, session=session
+            )
+            try:
+                await client.get_sensors_state()
+            except (AttributeError, BoPiError, KeyError, TypeError, ValueError):
+                # Unreachable, or another HTTP server answering, possibly with
+                # JSON that is not an object
+                return False
+            return True
+
+    hosts = [str(address) for address in network.hosts()]
+    hosts = [host for host in hosts if host not in exclude]
+    found = await asyncio.gather(*(_async_probe(host) for host in hosts))
+
+    controllers = [host for host, is_bopi in zip(hosts, found, strict=True) if is_bopi]
+    _LOGGER.debug(
+        "Found %s BoPi controller(s) among %s address(es) of %s",
+        len(controllers),
+        len(hosts),
+        network,
+    )
+    return controllers
@@ -0,0 +1,113 @@
+"""Base entity for BoPi integration."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import ATTR_STALE, DOMAIN
+from .coordinator import BoPiCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+@callback
+def async_remove_unused_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    platform: Platform,
+    unique_ids: set[str],
+) -> None:
+    """Remove the registry entries of entities that are no longer created.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        config_entry: Config entry for BoPi integration.
+        platform: Platform of the entities.
+        unique_ids: Unique IDs of the entities created by the platform.
+
+    """
+    entity_registry = er.async_get(hass)
+    for entry in er.async_entries_for_config_entry(
+        entity_registry, config_entry.entry_id
+    ):
+        if entry.domain == platform and entry.unique_id not in unique_ids:
+            entity_registry.async_remove(entry.entity_id)
+
+
+@callback
+def async_migrate_host(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    old_host: str,
+    new_host: str,
+) -> None:
+    """Move the entities and device of a controller to its new host.
+
+    Unique IDs and device identifiers embed the host, so they are rewritten
+    in place to keep the entity IDs, customizations and history.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        config_entry: Config entry for BoPi integration.
+        old_host: Previous host of the controller.
+        new_host: New host of the controller.
+
+    """
+    entity_registry = er.async_get(hass)
+    old_prefix = f"{old_host}_"
+    for entry in er.async_entries_for_config_entry(
+        entity_registry, config_entry.entry_id
+    ):
+        if not entry.unique_id.startswith(old_prefix):
+            continue
+        new_unique_id = f"{new_host}_{entry.unique_id.removeprefix(old_prefix)}"
+        if entity_registry.async_get_entity_id(entry.domain, DOMAIN, new_unique_id):
+            _LOGGER.warning(
+                "Cannot move %s to %s, the unique ID %s is already in use",
+                entry.entity_id,
+                new_host,
+                new_unique_id,
+            )
+            continue
+        entity_registry.async_update_entity(
+            entry.entity_id, new_unique_id=new_unique_id
+        )
+
+    device_registry = dr.async_get(hass)
+    if device := device_registry.async_get_device(identifiers={(DOMAIN, old_host)}):
+        device_registry.async_update_device(
+            device.id, new_identifiers={(DOMAIN, new_host)}
+        )
+
+
+class BoPiEntity(CoordinatorEntity[BoPiCoordinator]):
+    """Base class for BoPi entities."""
+
+    _attr_has_entity_name = True
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.coordinator.api.host)},
+            name="BoPi Controller",
+            manufacturer="BoPi",
+            model="BoPi Pool Controller",
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Flag values restored from the last known state."""
+        if self.coordinator.data and self.coordinator.data.get("stale"):
+            return {ATTR_STALE: True}
+        return None
@@ -0,0 +1,298 @@
+"""Time-series export for the BoPi integration.
+
+Buffers every reading of the controllers in memory and appends them in
+batches to a file, in InfluxDB line protocol or CSV, without going through
+the state machine or the recorder.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import csv
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DOMAIN,
+    EXPORT_BATCH_SIZE,
+    EXPORT_FILES,
+    EXPORT_FLUSH_INTERVAL,
+    EXPORT_MAX_QUEUE,
+    SENSOR_KEYS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_EXPORT: HassKey[dict[str, BoPiExportSink]] = HassKey(f"{DOMAIN}_export")
+
+
+@dataclass(frozen=True, slots=True)
+class ExportSample:
+    """Readings of a controller at one point in time."""
+
+    time: datetime
+    host: str
+    values: Mapping[str, float]
+
+
+class ExportWriter(ABC):  # pylint: disable=too-few-public-methods
+    """Appends batches of samples to a destination.
+
+    Subclasses implement write, which runs in the executor and may block.
+    """
+
+    @abstractmethod
+    def write(self, samples: list[ExportSample]) -> None:
+        """Write a batch of samples.
+
+        Args:
+        ----
+            samples: Samples in the order they were taken.
+
+        """
+
+
+class LineProtocolWriter(ExportWriter):  # pylint: disable=too-few-public-methods
+    """Appends samples to a file in InfluxDB line protocol."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the writer.
+
+        Args:
+        ----
+            path: File the samples are appended to.
+
+        """
+        self.path = path
+
+    def write(self, samples: list[ExportSample]) -> None:
+        """Append samples, one line per sample with the host as tag."""
+        lines = []
+        for sample in samples:
+            host = sample.host.replace(",", r"\,").replace(" ", r"\ ")
+            # Always floats, a field changing type is rejected by InfluxDB
+            fields = ",".join(
+                f"{key}={float(value)!r}" for key, value in sample.values.items()
+            )
+            timestamp = int(sample.time.timestamp() * 1e9)
+            lines.append(f"bopi,host={host} {fields} {timestamp}\n")
+
+        with self.path.open("a", encoding="utf-8") as file:
+            file.writelines(lines)
+
+
+class CsvWriter(ExportWriter):  # pylint: disable=too-few-public-methods
+    """Appends samples to a CSV file with one column per sensor."""
+
+    fieldnames = ("time", "host", *SENSOR_KEYS)
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the writer.
+
+        Args:
+        ----
+            path: File the samples are appended to.
+
+        """
+        self.path = path
+
+    def write(self, samples: list[ExportSample]) -> None:
+        """Append samples, writing the header to a new file."""
+        new_file = not self.path.exists() or not self.path.stat().st_size
+        with self.path.open("a", encoding="utf-8", newline="") as file:
+            writer = csv.DictWriter(file, fieldnames=self.fieldnames)
+            if new_file:
+                writer.writeheader()
+            writer.writerows(
+                {"time": sample.time.isoformat(), "host": sample.host, **sample.values}
+                for sample in samples
+            )
+
+
+WRITERS: dict[str, Callable[[Path], ExportWriter]] = {
+    "line_protocol": LineProtocolWriter,
+    "csv": CsvWriter,
+}
+
+
+class BoPiExportSink:  # pylint: disable=too-many-instance-attributes
+    """Bounded in-memory queue of samples flushed in batches to a writer.
+
+    A full batch is written at once and a partial one at the flush interval.
+    One batch is written at a time; while the writer lags behind, the queue
+    fills up and then drops its oldest samples. Shared sinks count their
+    users and are closed by the last one.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        writer: ExportWriter,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        flush_interval: float = EXPORT_FLUSH_INTERVAL,
+        max_queue: int = EXPORT_MAX_QUEUE,
+    ) -> None:
+        """Initialize the sink.
+
+        Args:
+        ----
+            hass: Home Assistant instance.
+            writer: Writer of the batches.
+            batch_size: Samples written at once.
+            flush_interval: Seconds between writes of a partial batch.
+            max_queue: Samples kept in memory before dropping the oldest ones.
+
+        """
+        self._hass = hass
+        self._writer = writer
+        self._batch_size = batch_size
+        self._queue: deque[ExportSample] = deque(maxlen=max_queue)
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+        self.users = 0
+        self.written = 0
+        self.dropped = 0
+        self.failed_batches = 0
+
+        self._unsub_timer = async_track_time_interval(
+            hass,
+            self._async_flush_on_time,
+            timedelta(seconds=flush_interval),
+            cancel_on_shutdown=True,
+        )
+        self._unsub_stop = hass.bus.async_listen(
+            EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_flush_on_stop
+        )
+
+    @property
+    def queued(self) -> int:
+        """Return the number of samples waiting to be written."""
+        return len(self._queue)
+
+    @callback
+    def add(self, sample: ExportSample) -> None:
+        """Queue a sample, dropping the oldest one when the queue is full.
+
+        Args:
+        ----
+            sample: Sample to export.
+
+        """
+        if len(self._queue) == self._queue.maxlen:
+            self.dropped += 1
+        self._queue.append(sample)
+        if len(self._queue) >= self._batch_size:
+            self._schedule_flush()
+
+    @callback
+    def _schedule_flush(self) -> None:
+        """Start a flush unless one is already running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._hass.async_create_background_task(
+                self.async_flush(), f"{DOMAIN} export flush"
+            )
+
+    @callback
+    def _async_flush_on_time(self, _: datetime) -> None:
+        """Write the partial batch waiting in the queue."""
+        if self._queue:
+            self._schedule_flush()
+
+    async def _async_flush_on_stop(self, _: Event[Any]) -> None:
+        """Write everything left before Home Assistant stops."""
+        self._unsub_timer()
+        await self.async_flush()
+
+    async def async_close(self) -> None:
+        """Stop writing on time and on stop, and write everything left."""
+        self._unsub_timer()
+        self._unsub_stop()
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Write the queued samples, one batch at a time."""
+        async with self._lock:
+            while self._queue:
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(self._batch_size, len(self._queue)))
+                ]
+                try:
+                    await self._hass.async_add_executor_job(self._writer.write, batch)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    # Writers are pluggable, any failure only loses this batch
+                    _LOGGER.exception("Failed to export %s BoPi sample(s)", len(batch))
+                    self.failed_batches += 1
+                    self.dropped += len(batch)
+                    return
+                self.written += len(batch)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the counters of the sink as a dictionary."""
+        return {
+            "queued": self.queued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "failed_batches": self.failed_batches,
+        }
+
+
+@callback
+def async_acquire_export_sink(
+    hass: HomeAssistant, export_format: str
+) -> BoPiExportSink:
+    """Return the export sink of a format, shared by all BoPi config entries.
+
+    Every entry exporting in a format appends to the same file, with the host
+    of the controller on each sample. Each call must be paired with a call to
+    async_release_export_sink.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        export_format: Key of EXPORT_FILES.
+
+    Returns:
+    -------
+        The domain-level export sink of the format.
+
+    """
+    sinks = hass.data.setdefault(DATA_EXPORT, {})
+    if (sink := sinks.get(export_format)) is None:
+        path = Path(hass.config.path(EXPORT_FILES[export_format]))
+        sink = sinks[export_format] = BoPiExportSink(hass, WRITERS[export_format](path))
+    sink.users += 1
+    return sink
+
+
+async def async_release_export_sink(hass: HomeAssistant, sink: BoPiExportSink) -> None:
+    """Stop using an export sink, closing it after its last user.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        sink: Sink returned by async_acquire_export_sink.
+
+    """
+    sink.users -= 1
+    if sink.users:
+        return
+
+    sinks = hass.data.get(DATA_EXPORT, {})
+    for export_format, shared in list(sinks.items()):
+        if shared is sink:
+            del sinks[export_format]
+    if not sinks:
+        hass.data.pop(DATA_EXPORT, None)
+    await sink.async_close()
@@ -0,0 +1,127 @@
+"""Sample filtering for the BoPi integration.
+
+Maps disconnected-probe sentinels to missing values and holds back readings
+that did not move beyond a deadband, so noise does not reach the state
+machine.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
+from time import monotonic
+from typing import Any
+
+from meetbopi.sensors_state import SensorsState
+
+from .const import SENSOR_SENTINELS
+
+
+@dataclass(frozen=True, slots=True)
+class PublishRule:
+    """When a new reading of a sensor is published."""
+
+    # Smallest change, in sensor units, that is published at once
+    deadband: float
+    # Seconds after which a reading is published even within the deadband
+    max_age: float | None
+
+    def holds(self, value: Any, published: Any, age: float) -> bool:
+        """Return True if a reading must be held back.
+
+        Args:
+        ----
+            value: New reading.
+            published: Last published reading.
+            age: Seconds elapsed since the last reading was published.
+
+        Returns:
+        -------
+            True if the reading stays within the deadband and is not too old.
+
+        """
+        if value is None or published is None:
+            return False
+        if self.max_age is not None and age >= self.max_age:
+            return False
+        return bool(abs(value - published) < self.deadband)
+
+
+def mask_sentinels(sensors_state: SensorsState) -> SensorsState:
+    """Replace sentinel readings of disconnected probes with None.
+
+    Args:
+    ----
+        sensors_state: Sensors state as reported by the controller.
+
+    Returns:
+    -------
+        Sensors state without sentinel readings.
+
+    """
+    changes = {
+        key: None
+        for key, sentinels in SENSOR_SENTINELS.items()
+        if getattr(sensors_state, key) in sentinels
+    }
+    return replace(sensors_state, **changes) if changes else sensors_state
+
+
+def disconnected_sensors(sensors_state: SensorsState) -> frozenset[str]:
+    """Return the sensors whose probe is disconnected.
+
+    Args:
+    ----
+        sensors_state: Sensors state without sentinel readings.
+
+    Returns:
+    -------
+        Keys of the sensors without a reading.
+
+    """
+    return frozenset(
+        key for key in SENSOR_SENTINELS if getattr(sensors_state, key) is None
+    )
+
+
+class SampleFilter:  # pylint: disable=too-few-public-methods
+    """Hold back readings that stay within their deadband."""
+
+    def __init__(self, rules: Mapping[str, PublishRule]) -> None:
+        """Initialize the filter.
+
+        Args:
+        ----
+            rules: Publish rule of each filtered sensor.
+
+        """
+        self._rules = rules
+        self._published: dict[str, tuple[Any, float]] = {}
+
+    def apply(self, sensors_state: SensorsState) -> SensorsState:
+        """Return the sensors state to publish.
+
+        Args:
+        ----
+            sensors_state: Sensors state without sentinel readings.
+
+        Returns:
+        -------
+            Sensors state where readings within their deadband are replaced
+            with the last published value.
+
+        """
+        now = monotonic()
+        held: dict[str, Any] = {}
+
+        for key, rule in self._rules.items():
+            value = getattr(sensors_state, key)
+            published = self._published.get(key)
+            if published is not None and rule.holds(
+                value, published[0], now - published[1]
+            ):
+                held[key] = published[0]
+            else:
+                self._published[key] = (value, now)
+
+        return replace(sensors_state, **held) if held else sensors_state
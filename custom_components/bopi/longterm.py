@@ -0,0 +1,263 @@
+"""Hourly long-term statistics of BoPi readings.
+
+The coordinator aggregates every reading into hourly buckets and imports them
+as external statistics once each hour is over, so graphs of the water
+sensors do not depend on the recorder storing their states. The hour in
+progress is kept in the snapshot store across restarts and reloads.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections import defaultdict
+from collections.abc import Mapping
+from typing import Any
+from dataclasses import dataclass
+from datetime import datetime
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import UnitOfElectricPotential, UnitOfTemperature
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.unit_conversion import (
+    ElectricPotentialConverter,
+    TemperatureConverter,
+)
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+RECORDER_DOMAIN = "recorder"
+
+# Name, unit and unit class of the statistic of each sensor
+STATISTIC_DESCRIPTIONS: dict[str, tuple[str, str | None, str | None]] = {
+    "temp1": (
+        "Water temperature 1",
+        UnitOfTemperature.CELSIUS,
+        TemperatureConverter.UNIT_CLASS,
+    ),
+    "phvalue": ("pH level", None, None),
+    "redoxvalue": (
+        "ORP level",
+        UnitOfElectricPotential.MILLIVOLT,
+        ElectricPotentialConverter.UNIT_CLASS,
+    ),
+}
+
+
+@dataclass(slots=True)
+class HourlyBucket:
+    """Mean, minimum and maximum of the readings of one hour."""
+
+    start: datetime
+    count: int = 0
+    total: float = 0.0
+    minimum: float = float("inf")
+    maximum: float = float("-inf")
+
+    def add(self, value: float) -> None:
+        """Add a reading to the bucket.
+
+        Args:
+        ----
+            value: Reading taken during the hour.
+
+        """
+        self.count += 1
+        self.total += value
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: HourlyBucket) -> None:
+        """Add the readings of another bucket of the same hour.
+
+        Args:
+        ----
+            other: Bucket of the same hour, e.g. restored after a restart.
+
+        """
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the bucket in its stored representation."""
+        return {
+            "start": self.start.isoformat(),
+            "count": self.count,
+            "total": self.total,
+            "minimum": self.minimum,
+            "maximum": self.maximum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> HourlyBucket:
+        """Rebuild a bucket from its stored representation.
+
+        Args:
+        ----
+            data: Bucket as returned by as_dict.
+
+        Returns:
+        -------
+            The stored bucket.
+
+        Raises:
+        ------
+            ValueError: If the bucket is empty or its start is invalid.
+
+        """
+        if (start := dt_util.parse_datetime(data["start"])) is None:
+            raise ValueError("Invalid bucket start")
+        bucket = cls(
+            start,
+            int(data["count"]),
+            float(data["total"]),
+            float(data["minimum"]),
+            float(data["maximum"]),
+        )
+        if bucket.count <= 0:
+            raise ValueError("Empty bucket")
+        return bucket
+
+    def as_statistic(self) -> StatisticData:
+        """Return the bucket as a row of hourly statistics."""
+        return StatisticData(
+            start=self.start,
+            mean=self.total / self.count,
+            min=self.minimum,
+            max=self.maximum,
+        )
+
+
+class BoPiLongTermStatistics:
+    """Hourly statistics of the sensors of one controller.
+
+    Hours are imported once they are over, one recorder job per sensor for
+    all the hours waiting. The hour in progress is never imported: a later
+    import of the same hour would replace it, so it is stored on shutdown
+    and restored on setup instead.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str, title: str) -> None:
+        """Initialize the statistics.
+
+        Args:
+        ----
+            hass: Home Assistant instance.
+            entry_id: Config entry identifier, part of the statistic IDs.
+            title: Config entry title, prefix of the statistic names.
+
+        """
+        self._hass = hass
+        self._entry_id = entry_id
+        self.title = title
+        self._buckets: dict[str, HourlyBucket] = {}
+        self._pending: defaultdict[str, list[StatisticData]] = defaultdict(list)
+        self.imported_hours = 0
+
+    def statistic_id(self, key: str) -> str:
+        """Return the external statistic ID of a sensor.
+
+        Args:
+        ----
+            key: Sensor key, e.g. "phvalue".
+
+        Returns:
+        -------
+            Statistic ID, stable across reconfiguration of the host.
+
+        """
+        return f"{DOMAIN}:{self._entry_id.lower()}_{key}"
+
+    @callback
+    def add(self, time: datetime, values: Mapping[str, float]) -> None:
+        """Add readings, importing the previous hour once it is over.
+
+        Args:
+        ----
+            time: When the readings were taken, in UTC.
+            values: Reading of each sensor of STATISTIC_DESCRIPTIONS.
+
+        """
+        hour = time.replace(minute=0, second=0, microsecond=0)
+        for key, value in values.items():
+            bucket = self._buckets.get(key)
+            if bucket is None or bucket.start != hour:
+                if bucket is not None:
+                    self._pending[key].append(bucket.as_statistic())
+                bucket = self._buckets[key] = HourlyBucket(hour)
+            bucket.add(value)
+
+        if self._pending:
+            self.async_import()
+
+    def buckets_to_store(self) -> dict[str, dict[str, Any]]:
+        """Return the hour in progress in its stored representation."""
+        return {key: bucket.as_dict() for key, bucket in self._buckets.items()}
+
+    @callback
+    def restore(self, stored: Mapping[str, Mapping[str, Any]]) -> None:
+        """Merge the stored hour in progress back into the buckets.
+
+        A stored hour that is over is imported, one that is still in progress
+        goes on with the readings taken since.
+
+        Args:
+        ----
+            stored: Buckets as returned by buckets_to_store.
+
+        Raises:
+        ------
+            KeyError: If a stored bucket misses a field.
+            TypeError: If a stored bucket is not a mapping.
+            ValueError: If a stored bucket is invalid.
+
+        """
+        restored = {
+            key: HourlyBucket.from_dict(data)
+            for key, data in stored.items()
+            if key in STATISTIC_DESCRIPTIONS
+        }
+        for key, bucket in restored.items():
+            current = self._buckets.get(key)
+            if current is None:
+                self._buckets[key] = bucket
+            elif current.start == bucket.start:
+                current.merge(bucket)
+            elif bucket.start < current.start:
+                self._pending[key].append(bucket.as_statistic())
+
+        if self._pending:
+            self.async_import()
+
+    @callback
+    def async_import(self) -> None:
+        """Queue the hours that are over for import by the recorder."""
+        pending, self._pending = self._pending, defaultdict(list)
+        if RECORDER_DOMAIN not in self._hass.config.components:
+            _LOGGER.debug("Recorder not loaded, dropping %s statistics", self.title)
+            return
+
+        for key, statistics in pending.items():
+            name, unit, unit_class = STATISTIC_DESCRIPTIONS[key]
+            metadata = StatisticMetaData(
+                has_sum=False,
+                mean_type=StatisticMeanType.ARITHMETIC,
+                name=f"{self.title} {name}",
+                source=DOMAIN,
+                statistic_id=self.statistic_id(key),
+                unit_class=unit_class,
+                unit_of_measurement=unit,
+            )
+            async_add_external_statistics(self._hass, metadata, statistics)
+            self.imported_hours += len(statistics)
@@ -0,0 +1,114 @@
+"""Poll-cycle metrics for the BoPi integration."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .const import LATENCY_BUCKETS
+
+
+class LatencyHistogram:
+    """Fixed-bucket histogram of durations in seconds."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS) -> None:
+        """Initialize the histogram.
+
+        Args:
+        ----
+            buckets: Upper bounds of the buckets in seconds, in ascending order.
+
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last: float | None = None
+
+    def record(self, seconds: float) -> None:
+        """Record a duration.
+
+        Args:
+        ----
+            seconds: Duration to record.
+
+        """
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        self.last = seconds
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram as a dictionary."""
+        bounds = [f"le_{bucket:g}" for bucket in self.buckets] + ["inf"]
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "max": self.max,
+            "last": self.last,
+            "buckets": dict(zip(bounds, self.counts, strict=True)),
+        }
+
+
+class PollMetrics:
+    """Latency, error and freshness metrics of a coordinator."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.fetch_latency = LatencyHistogram()
+        self.fanout_latency = LatencyHistogram()
+        self.errors: Counter[str] = Counter()
+        self.last_success: datetime | None = None
+        self.last_error: str | None = None
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed polls."""
+        return self.errors.total()
+
+    def record_success(self, latency: float) -> None:
+        """Record a successful poll.
+
+        Args:
+        ----
+            latency: Duration of the poll in seconds.
+
+        """
+        self.fetch_latency.record(latency)
+        self.last_success = dt_util.utcnow()
+
+    def record_failure(self, err: BaseException) -> None:
+        """Record a failed poll.
+
+        Args:
+        ----
+            err: Exception that made the poll fail.
+
+        """
+        self.errors[type(err).__name__] += 1
+        self.last_error = str(err)
+
+    def seconds_since_last_success(self) -> float | None:
+        """Return the seconds elapsed since the last successful poll."""
+        if self.last_success is None:
+            return None
+        return (dt_util.utcnow() - self.last_success).total_seconds()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "fetch_latency": self.fetch_latency.as_dict(),
+            "fanout_latency": self.fanout_latency.as_dict(),
+            "errors": dict(self.errors),
+            "last_error": self.last_error,
+            "last_success": self.last_success.isoformat()
+            if self.last_success
+            else None,
+            "seconds_since_last_success": self.seconds_since_last_success(),
+        }
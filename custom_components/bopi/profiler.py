@@ -0,0 +1,194 @@
+"""On-demand profiling of BoPi poll cycles."""
+
+from __future__ import annotations
+
+import cProfile
+import logging
+from collections import Counter
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import BoPiCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROFILE: HassKey[BoPiProfileSession] = HassKey(f"{DOMAIN}_profile")
+
+
+class BoPiProfileSession:
+    """cProfile run over the next poll cycles of some coordinators.
+
+    Python allows a single active profiler, so the coordinators share one,
+    enabled while any of them is in a cycle. Other work running on the event
+    loop during those cycles shows up in the report as well.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str) -> None:
+        """Initialize the session.
+
+        Args:
+        ----
+            hass: Home Assistant instance.
+            path: File the pstats report is written to.
+
+        """
+        self._hass = hass
+        self.path = path
+        self._profile: cProfile.Profile | None = cProfile.Profile()
+        self._remaining: dict[BoPiCoordinator, int] = {}
+        # Cycles in progress under the profiler, in total and per coordinator
+        self._active = 0
+        self._running: Counter[BoPiCoordinator] = Counter()
+        self._cycles = 0
+
+    def add(self, coordinator: BoPiCoordinator, cycles: int) -> None:
+        """Profile the next cycles of a coordinator.
+
+        Args:
+        ----
+            coordinator: Coordinator to profile.
+            cycles: Number of poll cycles to profile.
+
+        """
+        self._remaining[coordinator] = cycles
+        coordinator.profile = self
+
+    def cycle_started(self, coordinator: BoPiCoordinator) -> None:
+        """Enable the profiler for a poll cycle.
+
+        Args:
+        ----
+            coordinator: Coordinator whose cycle starts.
+
+        """
+        if self._profile is None or coordinator not in self._remaining:
+            return
+        if not self._active:
+            try:
+                self._profile.enable()
+            except ValueError:
+                # Another profiler took over since the session started
+                _LOGGER.warning("Another profiler is active, BoPi profile abandoned")
+                self._abandon()
+                return
+        self._active += 1
+        self._running[coordinator] += 1
+
+    def cycle_finished(self, coordinator: BoPiCoordinator) -> None:
+        """Disable the profiler after the last running poll cycle.
+
+        Args:
+        ----
+            coordinator: Coordinator whose cycle finished.
+
+        """
+        if not self._running[coordinator]:
+            # Started before the session, or while it was not profiled
+            return
+        self._running[coordinator] -= 1
+        self._active -= 1
+        if not self._active and self._profile is not None:
+            self._profile.disable()
+        if coordinator not in self._remaining:
+            # Released in the middle of the cycle, e.g. its entry unloaded
+            return
+        self._cycles += 1
+        self._remaining[coordinator] -= 1
+        if not self._remaining[coordinator]:
+            self.release(coordinator)
+
+    def release(self, coordinator: BoPiCoordinator) -> None:
+        """Stop profiling a coordinator, e.g. done or shutting down.
+
+        Args:
+        ----
+            coordinator: Coordinator to stop profiling.
+
+        """
+        coordinator.profile = None
+        self._remaining.pop(coordinator, None)
+        if not self._remaining:
+            self._finish()
+
+    @callback
+    def _abandon(self) -> None:
+        """Stop profiling every coordinator without writing a report."""
+        self._profile = None
+        self._hass.data.pop(DATA_PROFILE, None)
+        for coordinator in self._remaining:
+            coordinator.profile = None
+        self._remaining.clear()
+
+    @callback
+    def _finish(self) -> None:
+        """Write the report once every coordinator is done."""
+        if (profile := self._profile) is None:
+            return
+        self._profile = None
+        if self._active:
+            # A coordinator shut down in the middle of its cycle
+            profile.disable()
+        self._hass.data.pop(DATA_PROFILE, None)
+        self._hass.async_create_background_task(
+            self._async_write(profile), f"{DOMAIN} profile report"
+        )
+
+    async def _async_write(self, profile: cProfile.Profile) -> None:
+        """Write the pstats report to the configuration directory."""
+        await self._hass.async_add_executor_job(profile.dump_stats, self.path)
+        _LOGGER.info(
+            "BoPi profile of %s poll cycle(s) written to %s", self._cycles, self.path
+        )
+
+
+@callback
+def async_start_profile(
+    hass: HomeAssistant, coordinators: Iterable[BoPiCoordinator], cycles: int
+) -> str:
+    """Profile the next poll cycles of coordinators.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        coordinators: Coordinators to profile.
+        cycles: Number of poll cycles to profile for each coordinator.
+
+    Returns:
+    -------
+        Path of the pstats report, written once every cycle is profiled.
+
+    Raises:
+    ------
+        ServiceValidationError: If a profile is already running.
+        HomeAssistantError: If another profiler is active.
+
+    """
+    if DATA_PROFILE in hass.data:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="profile_running"
+        )
+
+    # Python allows a single active profiler, e.g. not while the Profiler
+    # integration runs
+    probe = cProfile.Profile()
+    try:
+        probe.enable()
+    except ValueError as err:
+        raise HomeAssistantError(
+            translation_domain=DOMAIN, translation_key="profiler_unavailable"
+        ) from err
+    probe.disable()
+
+    path = hass.config.path(f"{DOMAIN}_profile_{dt_util.now():%Y%m%d_%H%M%S}.prof")
+    session = hass.data[DATA_PROFILE] = BoPiProfileSession(hass, path)
+    for coordinator in coordinators:
+        session.add(coordinator, cycles)
+    return path
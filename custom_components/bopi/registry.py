@@ -0,0 +1,113 @@
+"""Domain-level registry of the BoPi coordinators.
+
+Lets the domain services reach the coordinator of every loaded config entry,
+whichever entry was set up first.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers.service import async_extract_config_entry_ids
+from homeassistant.helpers.target import TargetSelection
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import BoPiCoordinator
+
+DATA_REGISTRY: HassKey[BoPiRegistry] = HassKey(f"{DOMAIN}_registry")
+
+
+class BoPiRegistry:
+    """Coordinators of the loaded BoPi config entries."""
+
+    def __init__(self) -> None:
+        """Initialize the registry."""
+        self._coordinators: dict[str, BoPiCoordinator] = {}
+
+    @property
+    def coordinators(self) -> list[BoPiCoordinator]:
+        """Return the coordinators of every loaded config entry."""
+        return list(self._coordinators.values())
+
+    @callback
+    def register(
+        self, entry_id: str, coordinator: BoPiCoordinator
+    ) -> Callable[[], None]:
+        """Register the coordinator of a config entry.
+
+        Args:
+        ----
+            entry_id: Config entry identifier.
+            coordinator: Coordinator of the config entry.
+
+        Returns:
+        -------
+            Callback removing the coordinator from the registry.
+
+        """
+        self._coordinators[entry_id] = coordinator
+
+        @callback
+        def _unregister() -> None:
+            self._coordinators.pop(entry_id, None)
+
+        return _unregister
+
+    async def async_get_targets(self, call: ServiceCall) -> list[BoPiCoordinator]:
+        """Return the coordinators targeted by a service call.
+
+        Devices, areas and entities are resolved to their config entries. A
+        call without any target reaches every loaded config entry.
+
+        Args:
+        ----
+            call: Service call object.
+
+        Returns:
+        -------
+            Coordinators of the targeted loaded config entries.
+
+        Raises:
+        ------
+            ServiceValidationError: If no loaded BoPi device is targeted.
+
+        """
+        if not TargetSelection(call.data).has_any_target:
+            coordinators = self.coordinators
+        else:
+            coordinators = [
+                self._coordinators[entry_id]
+                for entry_id in await async_extract_config_entry_ids(call)
+                if entry_id in self._coordinators
+            ]
+
+        if not coordinators:
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="no_target_devices",
+            )
+        return coordinators
+
+
+@callback
+def async_get_registry(hass: HomeAssistant) -> BoPiRegistry:
+    """Return the registry shared by all BoPi config entries.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+
+    Returns:
+    -------
+        The domain-level coordinator registry.
+
+    """
+    if (registry := hass.data.get(DATA_REGISTRY)) is None:
+        registry = hass.data[DATA_REGISTRY] = BoPiRegistry()
+    return registry
@@ -0,0 +1,137 @@
+"""Rolling statistics for the BoPi integration.
+
+Keeps windowed min/max/mean of numeric readings in array-backed ring
+buffers, updated in amortized O(1) per sample.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from math import ceil
+
+
+class RollingWindow:  # pylint: disable=too-many-instance-attributes
+    """Min, max and mean of the samples received during a time window."""
+
+    def __init__(self, window: float, capacity: int) -> None:
+        """Initialize the rolling window.
+
+        Samples arriving much faster than one per window / capacity seconds
+        are dropped, so the buffer keeps covering the whole window.
+
+        Args:
+        ----
+            window: Length of the window in seconds.
+            capacity: Maximum number of samples kept.
+
+        """
+        self.window = window
+        self._capacity = capacity
+        # Leave some slack so that timer jitter does not drop regular samples
+        self._spacing = 0.9 * window / capacity
+        self._times = array("d", bytes(8 * capacity))
+        self._values = array("d", bytes(8 * capacity))
+        # Absolute indices of the oldest sample and of the next sample
+        self._head = 0
+        self._tail = 0
+        self._sum = 0.0
+        # Indices of candidate minimums (increasing) and maximums (decreasing)
+        self._min_queue: deque[int] = deque()
+        self._max_queue: deque[int] = deque()
+
+    @classmethod
+    def for_interval(cls, window: float, interval: float) -> RollingWindow:
+        """Create a rolling window sized for a sampling interval.
+
+        Args:
+        ----
+            window: Length of the window in seconds.
+            interval: Shortest expected interval between samples in seconds.
+
+        Returns:
+        -------
+            Rolling window able to hold one sample per interval.
+
+        """
+        return cls(window, max(1, ceil(window / interval)))
+
+    @property
+    def count(self) -> int:
+        """Return the number of samples in the window."""
+        return self._tail - self._head
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of the samples in the window."""
+        return self._sum / self.count if self.count else None
+
+    @property
+    def min(self) -> float | None:
+        """Return the minimum of the samples in the window."""
+        return self._value(self._min_queue[0]) if self._min_queue else None
+
+    @property
+    def max(self) -> float | None:
+        """Return the maximum of the samples in the window."""
+        return self._value(self._max_queue[0]) if self._max_queue else None
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Add a sample and drop the samples that left the window.
+
+        Args:
+        ----
+            timestamp: Monotonic time of the sample in seconds.
+            value: Sample value.
+
+        """
+        self.expire(timestamp)
+        if self.count and timestamp - self._time(self._tail - 1) < self._spacing:
+            return
+        if self.count == self._capacity:
+            self._evict()
+
+        index = self._tail
+        self._times[index % self._capacity] = timestamp
+        self._values[index % self._capacity] = value
+        self._tail += 1
+        self._sum += value
+
+        while self._min_queue and self._value(self._min_queue[-1]) >= value:
+            self._min_queue.pop()
+        self._min_queue.append(index)
+        while self._max_queue and self._value(self._max_queue[-1]) <= value:
+            self._max_queue.pop()
+        self._max_queue.append(index)
+
+    def expire(self, now: float) -> None:
+        """Drop the samples older than the window.
+
+        Args:
+        ----
+            now: Current monotonic time in seconds.
+
+        """
+        while self.count and self._time(self._head) <= now - self.window:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop the oldest sample."""
+        index = self._head
+        self._sum -= self._value(index)
+        if self._min_queue[0] == index:
+            self._min_queue.popleft()
+        if self._max_queue[0] == index:
+            self._max_queue.popleft()
+        self._head += 1
+        if not self.count:
+            # Reset the running sum to shed accumulated rounding errors
+            self._sum = 0.0
+
+    def _time(self, index: int) -> float:
+        """Return the timestamp of the sample at an absolute index."""
+        return self._times[index % self._capacity]
+
+    def _value(self, index: int) -> float:
+        """Return the value of the sample at an absolute index."""
+        return self._values[index % self._capacity]
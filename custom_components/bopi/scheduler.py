@@ -0,0 +1,120 @@
+"""Fleet-wide poll scheduler for the BoPi integration.
+
+Spreads the poll phase of every config entry across the scan interval and
+bounds how many controllers are polled at the same time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from datetime import timedelta
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, MAX_CONCURRENT_POLLS
+
+# Golden ratio conjugate, gives evenly spread phases for any number of entries
+_PHASE_STEP = 0.6180339887498949
+
+DATA_SCHEDULER: HassKey[BoPiPollScheduler] = HassKey(f"{DOMAIN}_scheduler")
+
+
+class BoPiPollScheduler:
+    """Spread and bound polls of all BoPi controllers."""
+
+    def __init__(self, max_concurrent: int = MAX_CONCURRENT_POLLS) -> None:
+        """Initialize the scheduler.
+
+        Args:
+        ----
+            max_concurrent: Maximum number of polls in flight at once.
+
+        """
+        self.max_concurrent = max_concurrent
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._slots: dict[str, int] = {}
+        self.in_flight = 0
+        self.queue_depth = 0
+
+    @callback
+    def register(self, entry_id: str) -> float:
+        """Register a config entry and return its poll phase.
+
+        Args:
+        ----
+            entry_id: Config entry identifier.
+
+        Returns:
+        -------
+            Phase of the entry as a fraction of the scan interval, in [0, 1).
+
+        """
+        if entry_id not in self._slots:
+            used = set(self._slots.values())
+            self._slots[entry_id] = next(
+                slot for slot in range(len(used) + 1) if slot not in used
+            )
+        return (self._slots[entry_id] * _PHASE_STEP) % 1
+
+    @callback
+    def unregister(self, entry_id: str) -> None:
+        """Release the poll phase of a config entry.
+
+        Args:
+        ----
+            entry_id: Config entry identifier.
+
+        """
+        self._slots.pop(entry_id, None)
+
+    def phase_offset(self, entry_id: str, interval: timedelta) -> timedelta:
+        """Return the delay that places an entry on its phase.
+
+        Args:
+        ----
+            entry_id: Config entry identifier.
+            interval: Scan interval of the entry.
+
+        Returns:
+        -------
+            Delay to add to the first scheduled poll.
+
+        """
+        return interval * self.register(entry_id)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Wait for a free poll slot and hold it while polling."""
+        self.queue_depth += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        self.in_flight += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+
+@callback
+def async_get_scheduler(hass: HomeAssistant) -> BoPiPollScheduler:
+    """Return the poll scheduler shared by all BoPi config entries.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+
+    Returns:
+    -------
+        The domain-level poll scheduler.
+
+    """
+    if (scheduler := hass.data.get(DATA_SCHEDULER)) is None:
+        scheduler = hass.data[DATA_SCHEDULER] = BoPiPollScheduler()
+    return scheduler
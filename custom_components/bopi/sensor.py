@@ -5,6 +5,10 @@ Provides sensor entities for BoPi device sensors accessed via HTTP API.
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass, replace
+from datetime import datetime
+
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -14,19 +18,40 @@ from homeassistant.components.sensor import (
 from homeassistant.const import (
     EntityCategory,
     PERCENTAGE,
+    Platform,
     UnitOfTemperature,
     UnitOfTime,
     UnitOfElectricPotential,
 )
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.typing import StateType
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BoPiConfigEntry
-from .const import DOMAIN
-from .coordinator import BoPiCoordinator
+from .breaker import BreakerState
+from .const import (
+    CONF_ROLLING_STATISTICS,
+    CONF_UPTIME_AS_BOOT_TIME,
+    DEFAULT_ROLLING_STATISTICS,
+    DEFAULT_UPTIME_AS_BOOT_TIME,
+    ROLLING_SENSORS,
+    ROLLING_STATISTICS,
+    ROLLING_WINDOWS,
+)
+from .coordinator import (
+    BOOT_TIME_CONTEXT,
+    DIAGNOSTICS_CONTEXT,
+    BoPiCoordinator,
+    value_accessor,
+)
+from .entity import BoPiEntity, async_remove_unused_entities
+
+
+@dataclass(frozen=True, kw_only=True)
+class BoPiDiagnosticSensorEntityDescription(SensorEntityDescription):
+    """Describes a BoPi sensor reporting on the integration itself."""
+
+    value_fn: Callable[[BoPiCoordinator], StateType | datetime]
 
 
 SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
@@ -90,14 +115,124 @@ SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
     ),
 )
 
+# Replaces the uptime sensor when uptime is published as a boot time
+BOOT_TIME_DESCRIPTION = SensorEntityDescription(
+    key="last_boot",
+    translation_key="last_boot",
+    device_class=SensorDeviceClass.TIMESTAMP,
+    entity_category=EntityCategory.DIAGNOSTIC,
+    icon="mdi:restart",
+)
+
+ROLLING_ICONS = {
+    "min": "mdi:arrow-collapse-down",
+    "max": "mdi:arrow-collapse-up",
+    "mean": "mdi:chart-bell-curve-cumulative",
+}
+
+# pylint: disable=unexpected-keyword-arg
+DIAGNOSTIC_SENSOR_DESCRIPTIONS: tuple[BoPiDiagnosticSensorEntityDescription, ...] = (
+    BoPiDiagnosticSensorEntityDescription(
+        key="circuit_breaker",
+        translation_key="circuit_breaker",
+        device_class=SensorDeviceClass.ENUM,
+        options=[state.value for state in BreakerState],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:electric-switch-closed",
+        value_fn=lambda coordinator: coordinator.breaker.state.value,
+    ),
+    BoPiDiagnosticSensorEntityDescription(
+        key="consecutive_failures",
+        translation_key="consecutive_failures",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:alert-circle-outline",
+        value_fn=lambda coordinator: coordinator.breaker.consecutive_failures,
+    ),
+    BoPiDiagnosticSensorEntityDescription(
+        key="circuit_breaker_trips",
+        translation_key="circuit_breaker_trips",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:debug-step-over",
+        value_fn=lambda coordinator: coordinator.breaker.trips,
+    ),
+    BoPiDiagnosticSensorEntityDescription(
+        key="poll_latency",
+        translation_key="poll_latency",
+        device_class=SensorDeviceClass.DURATION,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:timer-sand",
+        value_fn=lambda coordinator: (
+            None
+            if (latency := coordinator.metrics.fetch_latency.last) is None
+            else latency * 1000
+        ),
+    ),
+    BoPiDiagnosticSensorEntityDescription(
+        key="poll_errors",
+        translation_key="poll_errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:alert-octagon-outline",
+        value_fn=lambda coordinator: coordinator.metrics.error_count,
+    ),
+    BoPiDiagnosticSensorEntityDescription(
+        key="last_successful_poll",
+        translation_key="last_successful_poll",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:clock-check-outline",
+        value_fn=lambda coordinator: coordinator.metrics.last_success,
+    ),
+)
+
+
+def rolling_descriptions(sensors: frozenset[str]) -> list[SensorEntityDescription]:
+    """Return the descriptions of the rolling statistics sensors.
+
+    Args:
+    ----
+        sensors: Keys of the sensors that have an entity.
+
+    Returns:
+    -------
+        One description per sensor, window and statistic, derived from the
+        description of the sensor.
+
+    """
+    return [
+        replace(
+            description,
+            key=f"{description.key}_{window}_{statistic}",
+            translation_key=f"{description.key}_{statistic}",
+            translation_placeholders={"window": window.replace("h", " h")},
+            state_class=SensorStateClass.MEASUREMENT,
+            icon=ROLLING_ICONS[statistic],
+        )
+        for description in SENSOR_DESCRIPTIONS
+        if description.key in ROLLING_SENSORS and description.key in sensors
+        for window in ROLLING_WINDOWS
+        for statistic in ROLLING_STATISTICS
+    ]
+
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # pylint: disable=unused-argument
+    hass: HomeAssistant,
     config_entry: BoPiConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up BoPi sensor entities.
 
+    Only the sensors selected in the options are created, and the registry
+    entries of the other sensors are removed.
+
     Args:
     ----
         hass: Home Assistant instance.
@@ -106,34 +241,56 @@ async def async_setup_entry(
 
     """
     coordinator = config_entry.runtime_data.coordinator
+    uptime_as_boot_time = config_entry.options.get(
+        CONF_UPTIME_AS_BOOT_TIME, DEFAULT_UPTIME_AS_BOOT_TIME
+    )
 
-    async_add_entities(
-        BoPiSensor(coordinator, description) for description in SENSOR_DESCRIPTIONS
+    entities: list[SensorEntity] = [
+        BoPiSensor(coordinator, description)
+        for description in SENSOR_DESCRIPTIONS
+        if description.key in coordinator.sensors
+        and not (uptime_as_boot_time and description.key == "uptime")
+    ]
+    if uptime_as_boot_time and "uptime" in coordinator.sensors:
+        entities.append(
+            BoPiDerivedSensor(coordinator, BOOT_TIME_DESCRIPTION, BOOT_TIME_CONTEXT)
+        )
+    if config_entry.options.get(CONF_ROLLING_STATISTICS, DEFAULT_ROLLING_STATISTICS):
+        entities.extend(
+            BoPiDerivedSensor(coordinator, description, description.key)
+            for description in rolling_descriptions(coordinator.sensors)
+        )
+    entities.extend(
+        BoPiDiagnosticSensor(coordinator, description)
+        for description in DIAGNOSTIC_SENSOR_DESCRIPTIONS
     )
 
+    async_remove_unused_entities(
+        hass,
+        config_entry,
+        Platform.SENSOR,
+        {entity.unique_id for entity in entities if entity.unique_id},
+    )
+    async_add_entities(entities)
 
-class BoPiSensor(CoordinatorEntity[BoPiCoordinator], SensorEntity):
-    """Representation of a BoPi sensor."""
 
-    _attr_has_entity_name = True
+class BoPiSensor(BoPiEntity, SensorEntity):
+    """Representation of a BoPi sensor."""
 
     def __init__(
         self, coordinator: BoPiCoordinator, description: SensorEntityDescription
     ) -> None:
         """Initialize BoPi sensor entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=description.key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.api.host}_{description.key}"
-        self._sensor_key = description.key
+        self._value_fn = value_accessor(description.key)
 
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.api.host)},
-            name="BoPi Controller",
-            manufacturer="BoPi",
-            model="BoPi Pool Controller",
+    def available(self) -> bool:
+        """Return False while the probe of the sensor is disconnected."""
+        return super().available and (
+            self.entity_description.key not in self.coordinator.data["disconnected"]
         )
 
     @property
@@ -146,4 +303,66 @@ class BoPiSensor(CoordinatorEntity[BoPiCoordinator], SensorEntity):
         if not sensors_state:
             return None
 
-        return getattr(sensors_state, self._sensor_key, None)
+        return self._value_fn(sensors_state)
+
+
+class BoPiDerivedSensor(BoPiEntity, SensorEntity):
+    """Representation of a value computed from the BoPi readings."""
+
+    def __init__(
+        self,
+        coordinator: BoPiCoordinator,
+        description: SensorEntityDescription,
+        context: str,
+    ) -> None:
+        """Initialize BoPi derived sensor entity.
+
+        Args:
+        ----
+            coordinator: Coordinator of the controller.
+            description: Description of the sensor.
+            context: Key of the derived value, also used as listener context.
+
+        """
+        super().__init__(coordinator, context=context)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.api.host}_{description.key}"
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the derived value."""
+        if not self.coordinator.data:
+            return None
+
+        return self.coordinator.data["derived"].get(self.coordinator_context)
+
+
+class BoPiDiagnosticSensor(BoPiEntity, SensorEntity):
+    """Representation of a BoPi sensor reporting on the integration itself."""
+
+    entity_description: BoPiDiagnosticSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: BoPiCoordinator,
+        description: BoPiDiagnosticSensorEntityDescription,
+    ) -> None:
+        """Initialize BoPi diagnostic sensor entity."""
+        super().__init__(coordinator, context=DIAGNOSTICS_CONTEXT)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.api.host}_{description.key}"
+
+    @property
+    def available(self) -> bool:
+        """Return True, diagnostics are meaningful while the device is down."""
+        return True
+
+    @property
+    def extra_state_attributes(self) -> None:
+        """Return no attributes, diagnostics are never restored."""
+        return None
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the state value."""
+        return self.entity_description.value_fn(self.coordinator)
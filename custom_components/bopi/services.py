@@ -2,46 +2,296 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import TYPE_CHECKING
+from datetime import timedelta
+from typing import Any
 
-from homeassistant.core import HomeAssistant, ServiceCall
+import voluptuous as vol
 
-from .const import DOMAIN, SERVICE_REFRESH
+from homeassistant.config_entries import SOURCE_IMPORT
+from homeassistant.const import CONF_HOST, CONF_PORT, CONF_TIMEOUT
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util.json import JsonValueType
 
-if TYPE_CHECKING:
-    from . import RuntimeData
+from .const import (
+    ATTR_CYCLES,
+    ATTR_DEVICES,
+    ATTR_DURATION,
+    ATTR_INTERVAL,
+    ATTR_REFRESH,
+    BURST_MAX_DURATION,
+    BURST_MAX_INTERVAL,
+    BURST_MIN_INTERVAL,
+    DEFAULT_BURST_DURATION,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_PROFILE_CYCLES,
+    DEFAULT_TIMEOUT,
+    DOMAIN,
+    IMPORT_CONCURRENCY,
+    PROFILE_MAX_CYCLES,
+    SERVICE_GET_SNAPSHOT,
+    SERVICE_IMPORT_DEVICES,
+    SERVICE_PROFILE,
+    SERVICE_REFRESH,
+    SERVICE_SAMPLE_BURST,
+)
+from .profiler import async_start_profile
+from .registry import async_get_registry
 
 _LOGGER = logging.getLogger(__name__)
 
+REFRESH_SCHEMA = vol.Schema(cv.TARGET_SERVICE_FIELDS)
+
+SAMPLE_BURST_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Optional(ATTR_INTERVAL, default=DEFAULT_BURST_INTERVAL): vol.All(
+            vol.Coerce(int),
+            vol.Range(min=BURST_MIN_INTERVAL, max=BURST_MAX_INTERVAL),
+        ),
+        vol.Optional(ATTR_DURATION, default=DEFAULT_BURST_DURATION): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=BURST_MAX_DURATION)
+        ),
+    }
+)
+
+GET_SNAPSHOT_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Optional(ATTR_REFRESH, default=False): cv.boolean,
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        **cv.TARGET_SERVICE_FIELDS,
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=PROFILE_MAX_CYCLES)
+        ),
+    }
+)
 
-async def async_setup_services(hass: HomeAssistant, runtime_data: RuntimeData) -> None:
-    """Set up BoPi services.
+
+def _device_from_string(value: Any) -> dict[str, Any]:
+    """Coerce a ``host`` or ``host:port`` string to a device mapping.
 
     Args:
     ----
-        hass: Home Assistant instance.
-        runtime_data: Runtime data containing coordinator.
+        value: Device to import.
+
+    Returns:
+    -------
+        Device mapping, or the value itself when it is not a string.
 
     """
+    if not isinstance(value, str):
+        return value
+    host, sep, port = value.strip().rpartition(":")
+    # Bare hosts and IPv6 addresses without a port
+    if not sep or ":" in host:
+        return {CONF_HOST: value.strip()}
+    return {CONF_HOST: host, CONF_PORT: port}
+
+
+DEVICE_SCHEMA = vol.All(
+    _device_from_string,
+    vol.Schema(
+        {
+            vol.Required(CONF_HOST): cv.string,
+            vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
+            vol.Optional(CONF_TIMEOUT, default=DEFAULT_TIMEOUT): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=300)
+            ),
+        }
+    ),
+)
+
+IMPORT_DEVICES_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_DEVICES): vol.All(cv.ensure_list, [DEVICE_SCHEMA])}
+)
+
+
+async def _async_handle_refresh(call: ServiceCall) -> None:
+    """Handle refresh service call.
+
+    Every targeted device is refreshed concurrently; the fleet-wide poll
+    scheduler bounds how many are actually polled at once.
+
+    Args:
+    ----
+        call: Service call object.
+
+    """
+    coordinators = await async_get_registry(call.hass).async_get_targets(call)
+    await asyncio.gather(
+        *(coordinator.async_refresh_coalesced() for coordinator in coordinators)
+    )
+    _LOGGER.debug("BoPi sensor refresh forced on %s device(s)", len(coordinators))
+
+
+async def _async_handle_sample_burst(call: ServiceCall) -> None:
+    """Handle sample burst service call.
+
+    Args:
+    ----
+        call: Service call object.
+
+    """
+    coordinators = await async_get_registry(call.hass).async_get_targets(call)
+    interval = timedelta(seconds=call.data[ATTR_INTERVAL])
+    duration = timedelta(seconds=call.data[ATTR_DURATION])
+    await asyncio.gather(
+        *(
+            coordinator.async_start_burst(interval, duration)
+            for coordinator in coordinators
+        )
+    )
+
+
+async def _async_handle_get_snapshot(call: ServiceCall) -> ServiceResponse:
+    """Handle get snapshot service call.
+
+    Args:
+    ----
+        call: Service call object.
 
-    async def handle_refresh(
-        call: ServiceCall,  # pylint: disable=unused-argument
-    ) -> None:
-        """Handle refresh service call.
-
-        Args:
-        ----
-            call: Service call object.
-
-        """
-        await runtime_data.coordinator.async_request_refresh()
-        _LOGGER.debug("BoPi sensor refresh forced")
-
-    # Only register if not already registered
-    if not hass.services.has_service(DOMAIN, SERVICE_REFRESH):
-        hass.services.async_register(
-            DOMAIN,
-            SERVICE_REFRESH,
-            handle_refresh,
+    Returns:
+    -------
+        Latest sensors state of every targeted device.
+
+    """
+    coordinators = await async_get_registry(call.hass).async_get_targets(call)
+    if call.data[ATTR_REFRESH]:
+        await asyncio.gather(
+            *(coordinator.async_refresh_coalesced() for coordinator in coordinators)
         )
+    return {"devices": [coordinator.get_snapshot() for coordinator in coordinators]}
+
+
+async def _async_handle_import_devices(call: ServiceCall) -> ServiceResponse:
+    """Handle import devices service call.
+
+    Each device goes through the import step of the config flow, which
+    validates it like the user step does; up to IMPORT_CONCURRENCY devices
+    are validated at once.
+
+    Args:
+    ----
+        call: Service call object.
+
+    Returns:
+    -------
+        Hosts of the entries created, hosts already configured, and hosts
+        that failed with the reason.
+
+    """
+    # A host listed twice would abort as already in progress
+    devices = {device[CONF_HOST]: device for device in call.data[ATTR_DEVICES]}
+    semaphore = asyncio.Semaphore(IMPORT_CONCURRENCY)
+
+    async def _async_import(device: dict[str, Any]) -> tuple[str, str | None]:
+        async with semaphore:
+            result = await call.hass.config_entries.flow.async_init(
+                DOMAIN, context={"source": SOURCE_IMPORT}, data=device
+            )
+        if result["type"] is FlowResultType.CREATE_ENTRY:
+            return device[CONF_HOST], None
+        return device[CONF_HOST], result.get("reason", "unknown")
+
+    results = await asyncio.gather(
+        *(_async_import(device) for device in devices.values())
+    )
+
+    created: list[JsonValueType] = [host for host, reason in results if reason is None]
+    configured: list[JsonValueType] = [
+        host for host, reason in results if reason == "already_configured"
+    ]
+    failed: list[JsonValueType] = [
+        {CONF_HOST: host, "reason": reason}
+        for host, reason in results
+        if reason not in (None, "already_configured")
+    ]
+    _LOGGER.info(
+        "Imported %s BoPi device(s), %s already configured, %s failed",
+        len(created),
+        len(configured),
+        len(failed),
+    )
+    return {"created": created, "already_configured": configured, "failed": failed}
+
+
+async def _async_handle_profile(call: ServiceCall) -> ServiceResponse:
+    """Handle profile service call.
+
+    Args:
+    ----
+        call: Service call object.
+
+    Returns:
+    -------
+        Path of the report, written once the cycles are profiled.
+
+    """
+    coordinators = await async_get_registry(call.hass).async_get_targets(call)
+    path = async_start_profile(call.hass, coordinators, call.data[ATTR_CYCLES])
+    _LOGGER.info(
+        "Profiling the next %s poll cycle(s) of %s BoPi device(s) to %s",
+        call.data[ATTR_CYCLES],
+        len(coordinators),
+        path,
+    )
+    return {"path": path}
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Set up BoPi services.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+
+    """
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        _async_handle_refresh,
+        schema=REFRESH_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SAMPLE_BURST,
+        _async_handle_sample_burst,
+        schema=SAMPLE_BURST_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_GET_SNAPSHOT,
+        _async_handle_get_snapshot,
+        schema=GET_SNAPSHOT_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_DEVICES,
+        _async_handle_import_devices,
+        schema=IMPORT_DEVICES_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -12,15 +12,15 @@ from homeassistant.components.switch import (
     SwitchEntity,
     SwitchEntityDescription,
 )
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from . import BoPiConfigEntry
 from .const import DOMAIN
-from .coordinator import BoPiCoordinator
+from .coordinator import BoPiCoordinator, value_accessor
+from .entity import BoPiEntity, async_remove_unused_entities
 
 
 @dataclass(frozen=True, kw_only=True)
@@ -72,12 +72,15 @@ SWITCH_DESCRIPTIONS: tuple[BoPiSwitchEntityDescription, ...] = (
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # pylint: disable=unused-argument
+    hass: HomeAssistant,
     config_entry: BoPiConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up BoPi switch entities.
 
+    Only the switches selected in the options are created, and the registry
+    entries of the other switches are removed.
+
     Args:
     ----
         hass: Home Assistant instance.
@@ -87,16 +90,25 @@ async def async_setup_entry(
     """
     coordinator = config_entry.runtime_data.coordinator
 
-    async_add_entities(
-        BoPiSwitch(coordinator, description) for description in SWITCH_DESCRIPTIONS
+    entities = [
+        BoPiSwitch(coordinator, description)
+        for description in SWITCH_DESCRIPTIONS
+        if description.key in coordinator.switches
+    ]
+
+    async_remove_unused_entities(
+        hass,
+        config_entry,
+        Platform.SWITCH,
+        {entity.unique_id for entity in entities if entity.unique_id},
     )
+    async_add_entities(entities)
 
 
 # pylint: disable=abstract-method
-class BoPiSwitch(CoordinatorEntity[BoPiCoordinator], SwitchEntity):
+class BoPiSwitch(BoPiEntity, SwitchEntity):
     """Representation of a BoPi switch."""
 
-    _attr_has_entity_name = True
     entity_description: BoPiSwitchEntityDescription
 
     def __init__(
@@ -112,19 +124,10 @@ class BoPiSwitch(CoordinatorEntity[BoPiCoordinator], SwitchEntity):
             description: Entity description for this switch.
 
         """
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=description.data_key)
         self.entity_description = description
         self._attr_unique_id = f"{coordinator.api.host}_{description.key}"
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.coordinator.api.host)},
-            name="BoPi Controller",
-            manufacturer="BoPi",
-            model="BoPi Pool Controller",
-        )
+        self._value_fn = value_accessor(description.data_key)
 
     @property
     def is_on(self) -> bool:
@@ -136,15 +139,7 @@ class BoPiSwitch(CoordinatorEntity[BoPiCoordinator], SwitchEntity):
         if not sensors_state:
             return False
 
-        # Navigate nested structure for status
-        parts = self.entity_description.data_key.split(".")
-        obj = sensors_state
-        for part in parts:
-            obj = getattr(obj, part, None)
-            if obj is None:
-                return False
-
-        return bool(obj)
+        return bool(self._value_fn(sensors_state))
 
     async def async_turn_on(self, **kwargs: Any) -> None:  # noqa: ARG002
         """Turn on the switch.
@@ -0,0 +1,237 @@
+"""Benchmark of the BoPi poll-to-state pipeline.
+
+Measures what one poll cycle costs, from the coordinator update through the
+listener dispatch to the sensor and switch state writes, at several fleet
+sizes. The controllers are simulated in memory, so network time is left out
+and the figures only reflect the work done by Home Assistant and the
+integration.
+
+Usage::
+
+    python scripts/benchmark.py --save baseline.json
+    python scripts/benchmark.py --compare baseline.json
+
+Comparing exits with status 1 when CPU time or allocations per entry grew
+beyond the tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+from statistics import median
+from time import perf_counter, process_time
+from typing import Any
+
+from bopi_farm import SimulatedController
+from load_test import DOMAIN, async_add_entries, async_setup_hass
+from meetbopi import BoPiClient
+from meetbopi.sensors_state import SensorsState
+
+from homeassistant.const import EVENT_STATE_CHANGED, __version__ as HA_VERSION
+from homeassistant.core import Event, HomeAssistant, callback
+
+DEFAULT_SIZES = (1, 100, 1000)
+# Metrics compared against a baseline, all normalized per entry
+COMPARED_METRICS = ("cpu_us_per_entry", "alloc_peak_kib_per_entry")
+DEFAULT_TOLERANCE = 0.15
+
+
+def _install_simulated_client(seed: int) -> None:
+    """Answer every BoPi client from in-memory simulated controllers."""
+    rng = random.Random(seed)
+    controllers: dict[str, SimulatedController] = {}
+
+    async def _get_sensors_state(self: BoPiClient) -> SensorsState:
+        if (controller := controllers.get(self.host)) is None:
+            controller = controllers[self.host] = SimulatedController(rng)
+        self.sensors_state = SensorsState.from_dict(controller.payload())
+        return self.sensors_state
+
+    BoPiClient.get_sensors_state = _get_sensors_state
+
+
+async def _async_cycle(hass: HomeAssistant, coordinators: list[Any]) -> None:
+    """Run one poll cycle of every coordinator and flush the state writes."""
+    await asyncio.gather(*(coordinator.async_refresh() for coordinator in coordinators))
+    await hass.async_block_till_done()
+
+
+async def _async_traced_cycle(
+    hass: HomeAssistant, coordinators: list[Any]
+) -> tuple[int, int]:
+    """Run one poll cycle and return the peak and retained bytes it allocated."""
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    await _async_cycle(hass, coordinators)
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - before, after - before
+
+
+async def _async_bench_size(
+    hass: HomeAssistant, entries: int, cycles: int, warmup: int
+) -> dict[str, Any]:
+    """Benchmark the poll cycles of a fleet of a given size."""
+    # Polls are driven by the benchmark, keep the timers out of the way
+    await async_add_entries(hass, entries, 80, 5, {"scan_interval": 86400})
+    coordinators = [
+        entry.runtime_data.coordinator
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    ]
+    state_writes = 0
+
+    @callback
+    def _count_state_write(_: Event[Any]) -> None:
+        nonlocal state_writes
+        state_writes += 1
+
+    unsubscribe = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+
+    for _ in range(warmup):
+        await _async_cycle(hass, coordinators)
+
+    cpu: list[float] = []
+    wall: list[float] = []
+    state_writes = 0
+    for _ in range(cycles):
+        cpu_start, wall_start = process_time(), perf_counter()
+        await _async_cycle(hass, coordinators)
+        cpu.append(process_time() - cpu_start)
+        wall.append(perf_counter() - wall_start)
+    writes = state_writes / cycles
+    unsubscribe()
+
+    # Traced separately, tracing slows allocations down
+    peak, retained = await _async_traced_cycle(hass, coordinators)
+
+    return {
+        "entries": len(coordinators),
+        "entities": len(hass.states.async_entity_ids()),
+        "cycles": cycles,
+        "cpu_ms_per_cycle": round(median(cpu) * 1000, 3),
+        "cpu_us_per_entry": round(median(cpu) / len(coordinators) * 1e6, 1),
+        "wall_ms_per_cycle": round(median(wall) * 1000, 3),
+        "state_writes_per_cycle": round(writes, 1),
+        "alloc_peak_kib_per_entry": round(peak / len(coordinators) / 1024, 2),
+        "retained_kib_per_cycle": round(retained / 1024, 2),
+    }
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark at every fleet size.
+
+    Args:
+    ----
+        args: Parsed command line options.
+
+    Returns:
+    -------
+        Results keyed by fleet size, with the environment they ran in.
+
+    """
+    _install_simulated_client(args.seed)
+    results: dict[str, Any] = {}
+    # Imported integrations are cached for the process, so every instance
+    # shares the configuration directory
+    with tempfile.TemporaryDirectory() as config_dir:
+        for size in args.sizes:
+            # A fresh instance and storage per size, so sizes do not interact
+            shutil.rmtree(Path(config_dir) / ".storage", ignore_errors=True)
+            hass = await async_setup_hass(config_dir)
+            try:
+                results[str(size)] = await _async_bench_size(
+                    hass, size, args.cycles, args.warmup
+                )
+            finally:
+                await hass.async_stop(force=True)
+            print(_format_result(results[str(size)]), flush=True)
+
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "homeassistant": HA_VERSION,
+            "machine": platform.machine(),
+        },
+        "results": results,
+    }
+
+
+def _format_result(result: dict[str, Any]) -> str:
+    """Return a result as a single line."""
+    return (
+        f"{result['entries']:>5} entries  "
+        f"{result['cpu_ms_per_cycle']:>9.3f} ms CPU/cycle  "
+        f"{result['cpu_us_per_entry']:>8.1f} us CPU/entry  "
+        f"{result['wall_ms_per_cycle']:>9.3f} ms wall/cycle  "
+        f"{result['state_writes_per_cycle']:>7.1f} writes/cycle  "
+        f"{result['alloc_peak_kib_per_entry']:>7.2f} KiB peak/entry"
+    )
+
+
+def _compare(
+    report: dict[str, Any], baseline: dict[str, Any], tolerance: float
+) -> bool:
+    """Print the change of each metric against a baseline.
+
+    Returns
+    -------
+        True if no metric regressed beyond the tolerance.
+
+    """
+    if baseline.get("environment") != report["environment"]:
+        print(f"Baseline environment differs: {baseline.get('environment')}")
+
+    passed = True
+    for size, result in report["results"].items():
+        if (reference := baseline["results"].get(size)) is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if not reference[metric]:
+                continue
+            ratio = result[metric] / reference[metric]
+            regressed = ratio > 1 + tolerance
+            passed &= not regressed
+            print(
+                f"{size:>5} entries  {metric:<26} {reference[metric]:>9} -> "
+                f"{result[metric]:>9}  {ratio - 1:+.1%}"
+                + ("  REGRESSION" if regressed else "")
+            )
+    return passed
+
+
+def main() -> None:
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--cycles", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", type=Path, help="save the results as a baseline")
+    parser.add_argument("--compare", type=Path, help="baseline to compare with")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    report = asyncio.run(async_run(args))
+
+    if args.save:
+        args.save.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if not _compare(report, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Micro-benchmark of the value lookups of BoPi entities.
+
+Compares, for thousands of entities reading their value from a sensors state:
+
+- ``walk``: the lookup entities used to do on every state read, splitting
+  the dotted data path and following it with getattr;
+- ``accessor``: the compiled accessors entities resolve once at setup;
+- ``flat``: plain attribute reads on a flat ``__slots__`` copy of the sensors
+  state, including the cost of building the copy of each device once per
+  poll.
+
+Entities only read their value when it changed, so ``--changed`` sets how many
+values of each device change per poll, all of them by default.
+
+Usage::
+
+    python scripts/benchmark_accessors.py --entities 1200 12000 --changed 3
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+from collections.abc import Callable
+from functools import partial
+from statistics import median
+from timeit import repeat
+from typing import Any
+
+from bopi_farm import SimulatedController
+from load_test import REPOSITORY
+from meetbopi.sensors_state import SensorsState
+
+sys.path.insert(0, str(REPOSITORY))
+
+# pylint: disable-next=wrong-import-position,import-error
+from custom_components.bopi.coordinator import value_accessor  # noqa: E402
+
+SENSOR_PATHS = ("temp1", "temp2", "boxtemp", "boxhumidity", "phvalue", "redoxvalue")
+SWITCH_PATHS = tuple(
+    f"{relay}.status"
+    for relay in ("pool_pump", "pool_lights", "relay1", "relay2", "relay3", "relay4")
+)
+PATHS = SENSOR_PATHS + SWITCH_PATHS
+
+
+class FlatSnapshot:  # pylint: disable=too-few-public-methods,too-many-instance-attributes
+    """Sensors state flattened into one slotted object, keyed by flat names."""
+
+    __slots__ = tuple(path.replace(".", "_") for path in PATHS)
+
+    def __init__(self, sensors_state: SensorsState) -> None:
+        """Copy every benchmarked path of a sensors state."""
+        self.temp1 = sensors_state.temp1
+        self.temp2 = sensors_state.temp2
+        self.boxtemp = sensors_state.boxtemp
+        self.boxhumidity = sensors_state.boxhumidity
+        self.phvalue = sensors_state.phvalue
+        self.redoxvalue = sensors_state.redoxvalue
+        self.pool_pump_status = sensors_state.pool_pump.status
+        self.pool_lights_status = sensors_state.pool_lights.status
+        self.relay1_status = sensors_state.relay1.status
+        self.relay2_status = sensors_state.relay2.status
+        self.relay3_status = sensors_state.relay3.status
+        self.relay4_status = sensors_state.relay4.status
+
+
+def walk(sensors_state: SensorsState, path: str) -> Any:
+    """Return the value at a dotted path, the way entities used to."""
+    value: Any = sensors_state
+    for part in path.split("."):
+        value = getattr(value, part, None)
+        if value is None:
+            return None
+    return value
+
+
+def _lookups(changed: int) -> dict[str, Callable[[list[SensorsState]], None]]:
+    """Return one poll's worth of value reads of every device for each path.
+
+    Args:
+    ----
+        changed: Number of values read per device, those that changed.
+
+    Returns:
+    -------
+        Lookup of the values of a poll along each path, keyed by path name.
+
+    """
+    paths = PATHS[:changed]
+    accessors = [value_accessor(path) for path in paths]
+    flat_names = [path.replace(".", "_") for path in paths]
+
+    def _walk(states: list[SensorsState]) -> None:
+        for sensors_state in states:
+            for path in paths:
+                walk(sensors_state, path)
+
+    def _accessor(states: list[SensorsState]) -> None:
+        for sensors_state in states:
+            for accessor in accessors:
+                accessor(sensors_state)
+
+    def _flat(states: list[SensorsState]) -> None:
+        # Each coordinator publishes its own snapshot once per poll
+        for sensors_state in states:
+            snapshot = FlatSnapshot(sensors_state)
+            for name in flat_names:
+                getattr(snapshot, name)
+
+    return {"walk": _walk, "accessor": _accessor, "flat": _flat}
+
+
+def main() -> None:
+    """Run the micro-benchmark from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, nargs="+", default=[1200, 12000])
+    parser.add_argument("--number", type=int, default=200, help="polls per run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--changed",
+        type=int,
+        choices=range(1, len(PATHS) + 1),
+        default=len(PATHS),
+        metavar=f"1-{len(PATHS)}",
+        help="values changed per device and poll",
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    for entities in args.entities:
+        # Every device has one entity per benchmarked path
+        states = [
+            SensorsState.from_dict(SimulatedController(rng).payload())
+            for _ in range(max(1, entities // len(PATHS)))
+        ]
+        results = {
+            name: median(
+                repeat(partial(lookup, states), number=args.number, repeat=args.repeat)
+            )
+            / args.number
+            for name, lookup in _lookups(args.changed).items()
+        }
+        print(
+            f"{len(states) * len(PATHS):>6} entities  "
+            + "  ".join(
+                f"{name} {seconds * 1e3:7.3f} ms/poll ({seconds / results['walk']:.0%})"
+                for name, seconds in results.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""Simulated BoPi controllers for local development and load tests.
+
+Serves the ``allsensorsv2`` endpoint of the BoPi HTTP API for many controllers
+at once, one per loopback address, with readings drifting like a real pool and
+configurable latency, jitter, timeouts, errors and malformed responses.
+
+Usage::
+
+    python scripts/bopi_farm.py --devices 100 --latency 0.05 --jitter 0.02
+
+Controllers listen on consecutive addresses from 127.0.1.1, which Linux routes
+to the loopback interface without any setup.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+from dataclasses import dataclass
+from ipaddress import IPv4Address
+from time import monotonic
+from typing import Any
+
+from aiohttp import web
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_FIRST_ADDRESS = IPv4Address("127.0.1.1")
+DEFAULT_PORT = 8080
+# Longer than any client timeout, so the request is abandoned by the client
+HANG_SECONDS = 3600
+
+
+@dataclass(frozen=True, slots=True)
+class FarmBehavior:
+    """Latency and failure profile of the simulated controllers."""
+
+    latency: float = 0.0
+    jitter: float = 0.0
+    timeout_rate: float = 0.0
+    error_rate: float = 0.0
+    malformed_rate: float = 0.0
+
+
+class SimulatedController:  # pylint: disable=too-few-public-methods
+    """Readings of one simulated controller, drifting between requests."""
+
+    def __init__(self, rng: random.Random) -> None:
+        """Initialize the controller with randomized readings.
+
+        Args:
+        ----
+            rng: Random generator shared by the farm.
+
+        """
+        self._rng = rng
+        self._started = monotonic()
+        self.temp1 = rng.uniform(18.0, 30.0)
+        self.boxtemp = rng.uniform(25.0, 40.0)
+        self.boxhumidity = rng.uniform(30.0, 60.0)
+        self.phvalue = rng.uniform(6.8, 7.6)
+        self.redoxvalue = rng.uniform(600.0, 750.0)
+        self.pump_on = rng.random() < 0.5
+
+    def _drift(self, value: float, step: float, low: float, high: float) -> float:
+        """Return a value moved by a random step, kept within bounds."""
+        return min(high, max(low, value + self._rng.uniform(-step, step)))
+
+    def payload(self) -> dict[str, Any]:
+        """Return the next ``allsensorsv2`` payload.
+
+        Returns
+        -------
+            Payload shaped like the one of a BoPi controller.
+
+        """
+        self.temp1 = self._drift(self.temp1, 0.05, 5.0, 40.0)
+        self.boxtemp = self._drift(self.boxtemp, 0.2, 10.0, 60.0)
+        self.boxhumidity = self._drift(self.boxhumidity, 0.5, 0.0, 100.0)
+        self.phvalue = self._drift(self.phvalue, 0.01, 6.0, 8.5)
+        self.redoxvalue = self._drift(self.redoxvalue, 2.0, 400.0, 900.0)
+        if self._rng.random() < 0.01:
+            self.pump_on = not self.pump_on
+
+        return {
+            "temp1": round(self.temp1, 2),
+            # Second probe unplugged, as on most installations
+            "temp2": -127,
+            "boxtemp": round(self.boxtemp, 1),
+            "boxhumidity": round(self.boxhumidity),
+            "phvalue": round(self.phvalue, 2),
+            "redoxvalue": round(self.redoxvalue),
+            "mode": "auto",
+            "uptime": int(monotonic() - self._started),
+            "lphi": 0,
+            "tphi": 0,
+            "lorpi": 0,
+            "torpi": 0,
+            "poolPump": {"status": int(self.pump_on), "override": 0, "timeleft": 0},
+            "poolLights": {"status": 0, "override": 0, "timeleft": 0},
+            **{
+                f"relay{index}": {
+                    "status": 0,
+                    "override": 0,
+                    "timeleft": 0,
+                    "role": "none",
+                }
+                for index in range(1, 5)
+            },
+        }
+
+
+class BoPiFarm:
+    """HTTP server answering for many simulated controllers."""
+
+    def __init__(
+        self,
+        devices: int,
+        behavior: FarmBehavior,
+        first_address: IPv4Address = DEFAULT_FIRST_ADDRESS,
+        port: int = DEFAULT_PORT,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the farm.
+
+        Args:
+        ----
+            devices: Number of simulated controllers.
+            behavior: Latency and failure profile of the controllers.
+            first_address: Loopback address of the first controller.
+            port: Port every controller listens on.
+            seed: Seed of the random generator, for repeatable runs.
+
+        """
+        self.behavior = behavior
+        self.port = port
+        self.hosts = [str(first_address + index) for index in range(devices)]
+        self._rng = random.Random(seed)
+        self._controllers = {
+            host: SimulatedController(self._rng) for host in self.hosts
+        }
+        self._runner: web.AppRunner | None = None
+
+    async def async_start(self) -> None:
+        """Start listening on the address of every controller."""
+        app = web.Application()
+        app.router.add_get("/allsensorsv2", self._async_handle_sensors)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        for host in self.hosts:
+            await web.TCPSite(self._runner, host, self.port).start()
+        _LOGGER.info(
+            "Simulating %s controller(s) from %s:%s",
+            len(self.hosts),
+            self.hosts[0],
+            self.port,
+        )
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def _async_handle_sensors(self, request: web.Request) -> web.StreamResponse:
+        """Answer a sensors state request like the addressed controller."""
+        # Clients address the controller in the Host header, as on a LAN
+        if (controller := self._controllers.get(request.url.host or "")) is None:
+            raise web.HTTPNotFound
+        behavior = self.behavior
+        rng = self._rng
+
+        delay = behavior.latency + rng.uniform(-behavior.jitter, behavior.jitter)
+        await asyncio.sleep(max(0.0, delay))
+
+        payload = controller.payload()
+        roll = rng.random()
+        if roll < behavior.timeout_rate:
+            await asyncio.sleep(HANG_SECONDS)
+        roll -= behavior.timeout_rate
+        if roll < behavior.error_rate:
+            return web.Response(status=500, text="Internal Server Error")
+        roll -= behavior.error_rate
+        if roll < behavior.malformed_rate:
+            return self._malformed_response(payload)
+
+        return web.json_response(payload)
+
+    def _malformed_response(self, payload: dict[str, Any]) -> web.Response:
+        """Return one of the broken answers seen from real controllers."""
+        kind = self._rng.randrange(5)
+        if kind == 0:
+            # Truncated body
+            return web.Response(
+                text=json.dumps(payload)[:40], content_type="application/json"
+            )
+        if kind == 1:
+            del payload["poolPump"]
+        elif kind == 2:
+            payload["phvalue"] = 42
+        elif kind == 3:
+            # Valid JSON that is not an object, e.g. from another API
+            return web.json_response(self._rng.choice(([], "ok", None)))
+        else:
+            # Captive portal or another web server on the address
+            return web.Response(text="<html></html>", content_type="text/html")
+        return web.json_response(payload)
+
+
+def add_behavior_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of the simulated controllers to a parser.
+
+    Args:
+    ----
+        parser: Parser of the command line.
+
+    """
+    parser.add_argument("--devices", type=int, default=10)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    parser.add_argument("--jitter", type=float, default=0.01, help="seconds")
+    parser.add_argument("--timeout-rate", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+
+
+def farm_from_arguments(args: argparse.Namespace) -> BoPiFarm:
+    """Create a farm from parsed command line options.
+
+    Args:
+    ----
+        args: Options added by add_behavior_arguments.
+
+    Returns:
+    -------
+        Farm, not started yet.
+
+    """
+    behavior = FarmBehavior(
+        latency=args.latency,
+        jitter=args.jitter,
+        timeout_rate=args.timeout_rate,
+        error_rate=args.error_rate,
+        malformed_rate=args.malformed_rate,
+    )
+    return BoPiFarm(args.devices, behavior, port=args.port, seed=args.seed)
+
+
+async def _async_main(args: argparse.Namespace) -> None:
+    """Run the farm until interrupted."""
+    farm = farm_from_arguments(args)
+    await farm.async_start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await farm.async_stop()
+
+
+def main() -> None:
+    """Run the farm from the command line."""
+    logging.basicConfig(level=logging.INFO)
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_behavior_arguments(parser)
+    try:
+        asyncio.run(_async_main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,357 @@
+"""Load test of the BoPi integration against simulated controllers.
+
+Starts the simulated controllers of bopi_farm.py in a separate process, sets up
+one config entry per controller in a throwaway Home Assistant instance, lets
+them poll for a while and reports poll throughput, fetch latency percentiles,
+event loop lag and memory per entry.
+
+Usage::
+
+    python scripts/load_test.py --devices 200 --interval 10 --duration 120
+
+Options after the entry count mirror bopi_farm.py, e.g. ``--timeout-rate 0.01
+--malformed-rate 0.02``. Use ``--json`` to save the report for comparisons.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+import tempfile
+import tracemalloc
+from collections import Counter
+from pathlib import Path
+from statistics import quantiles
+from time import monotonic
+from types import MappingProxyType
+from typing import Any
+
+from bopi_farm import DEFAULT_FIRST_ADDRESS, add_behavior_arguments
+
+from homeassistant import bootstrap, loader
+from homeassistant.components.network.network import async_get_network
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+
+_LOGGER = logging.getLogger(__name__)
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+FARM_SCRIPT = Path(__file__).resolve().parent / "bopi_farm.py"
+DOMAIN = "bopi"
+# Seconds between event loop lag samples
+LAG_SAMPLE_INTERVAL = 0.05
+PERCENTILES = (50, 95, 99)
+
+
+class LoopLagMonitor:
+    """Measure how late the event loop runs a periodic callback."""
+
+    def __init__(self, interval: float = LAG_SAMPLE_INTERVAL) -> None:
+        """Initialize the monitor.
+
+        Args:
+        ----
+            interval: Seconds between samples.
+
+        """
+        self._interval = interval
+        self._task: asyncio.Task[None] | None = None
+        self.samples: list[float] = []
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._task = asyncio.create_task(self._async_run())
+
+    def stop(self) -> None:
+        """Stop sampling."""
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _async_run(self) -> None:
+        """Record the delay of every wake-up past its deadline."""
+        while True:
+            deadline = monotonic() + self._interval
+            await asyncio.sleep(self._interval)
+            self.samples.append(max(0.0, monotonic() - deadline))
+
+
+def _percentiles(samples: list[float]) -> dict[str, float | None]:
+    """Return the percentiles of samples, None when there are too few."""
+    if len(samples) < 2:
+        return {f"p{percentile}": None for percentile in PERCENTILES}
+    cuts = quantiles(samples, n=100, method="inclusive")
+    return {f"p{percentile}": cuts[percentile - 1] for percentile in PERCENTILES}
+
+
+def _histogram_percentiles(
+    buckets: tuple[float, ...], counts: list[int]
+) -> dict[str, float | None]:
+    """Return the upper bound of the bucket holding each percentile."""
+    total = sum(counts)
+    result: dict[str, float | None] = {}
+    for percentile in PERCENTILES:
+        if not total:
+            result[f"p{percentile}"] = None
+            continue
+        rank = total * percentile / 100
+        seen = 0
+        for bound, count in zip((*buckets, float("inf")), counts, strict=True):
+            seen += count
+            if seen >= rank:
+                result[f"p{percentile}"] = bound
+                break
+    return result
+
+
+def _latency_buckets(hass: HomeAssistant) -> tuple[float, ...]:
+    """Return the bucket bounds of the fetch latency histograms."""
+    entry = hass.config_entries.async_loaded_entries(DOMAIN)[0]
+    buckets: tuple[float, ...] = (
+        entry.runtime_data.coordinator.metrics.fetch_latency.buckets
+    )
+    return buckets
+
+
+def _poll_counters(hass: HomeAssistant) -> tuple[list[int], Counter[str]]:
+    """Return the fetch latency bucket counts and the errors of all entries."""
+    metrics = [
+        entry.runtime_data.coordinator.metrics
+        for entry in hass.config_entries.async_loaded_entries(DOMAIN)
+    ]
+    counts = [
+        sum(column)
+        for column in zip(*(m.fetch_latency.counts for m in metrics), strict=True)
+    ]
+    errors: Counter[str] = Counter()
+    for entry_metrics in metrics:
+        errors.update(entry_metrics.errors)
+    return counts, errors
+
+
+async def _async_start_farm(args: argparse.Namespace) -> asyncio.subprocess.Process:
+    """Start the simulated controllers and wait until they accept connections."""
+    farm_args = [
+        f"--devices={args.devices}",
+        f"--port={args.port}",
+        f"--latency={args.latency}",
+        f"--jitter={args.jitter}",
+        f"--timeout-rate={args.timeout_rate}",
+        f"--error-rate={args.error_rate}",
+        f"--malformed-rate={args.malformed_rate}",
+    ]
+    if args.seed is not None:
+        farm_args.append(f"--seed={args.seed}")
+    process = await asyncio.create_subprocess_exec(
+        sys.executable, str(FARM_SCRIPT), *farm_args
+    )
+
+    last_host = str(DEFAULT_FIRST_ADDRESS + args.devices - 1)
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection(last_host, args.port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return process
+
+    process.terminate()
+    raise RuntimeError("The simulated controllers did not start")
+
+
+async def async_setup_hass(config_dir: str) -> HomeAssistant:
+    """Create a Home Assistant instance loading the integration of the repo.
+
+    Args:
+    ----
+        config_dir: Configuration directory, usually empty.
+
+    Returns:
+    -------
+        Home Assistant instance, not started.
+
+    """
+    if not (link := Path(config_dir) / "custom_components").exists():
+        link.symlink_to(REPOSITORY / "custom_components")
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    hass.config_entries = ConfigEntries(hass, {})
+    loader.async_setup(hass)
+    await bootstrap.async_load_base_functionality(hass)
+    await async_get_network(hass)
+    return hass
+
+
+async def async_add_entries(
+    hass: HomeAssistant,
+    devices: int,
+    port: int,
+    timeout: int,
+    options: dict[str, Any],
+) -> None:
+    """Add and set up one config entry per simulated controller.
+
+    Args:
+    ----
+        hass: Home Assistant instance.
+        devices: Number of simulated controllers.
+        port: Port of the simulated controllers.
+        timeout: Request timeout of the entries in seconds.
+        options: Options of the entries.
+
+    """
+    for index in range(devices):
+        host = str(DEFAULT_FIRST_ADDRESS + index)
+        entry = ConfigEntry(
+            data={"host": host, "port": port, "timeout": timeout},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options=options,
+            source=SOURCE_USER,
+            subentries_data=None,
+            title=f"BoPi ({host})",
+            unique_id=f"BoPi ({host})",
+            version=1,
+        )
+        await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the load test.
+
+    Args:
+    ----
+        args: Parsed command line options.
+
+    Returns:
+    -------
+        Report of the run.
+
+    """
+    farm = await _async_start_farm(args)
+    try:
+        with tempfile.TemporaryDirectory() as config_dir:
+            hass = await async_setup_hass(config_dir)
+            try:
+                return await _async_measure(hass, args)
+            finally:
+                await hass.async_stop(force=True)
+    finally:
+        farm.terminate()
+        await farm.wait()
+
+
+async def _async_traced_setup(
+    hass: HomeAssistant, args: argparse.Namespace
+) -> tuple[float, int]:
+    """Set up the entries and return the seconds and bytes it took."""
+    tracemalloc.start()
+    setup_start = monotonic()
+    await async_add_entries(
+        hass,
+        args.devices,
+        args.port,
+        args.timeout,
+        {"scan_interval": args.interval},
+    )
+    setup_seconds = monotonic() - setup_start
+    traced, _ = tracemalloc.get_traced_memory()
+    # Tracing slows allocations down, keep it out of the timed window
+    tracemalloc.stop()
+    return setup_seconds, traced
+
+
+async def _async_measure(
+    hass: HomeAssistant, args: argparse.Namespace
+) -> dict[str, Any]:
+    """Set up the entries, let them poll and collect the report."""
+    setup_seconds, traced = await _async_traced_setup(hass, args)
+
+    start_counts, start_errors = _poll_counters(hass)
+    monitor = LoopLagMonitor()
+    monitor.start()
+    window_start = monotonic()
+    await asyncio.sleep(args.duration)
+    window = monotonic() - window_start
+    monitor.stop()
+    end_counts, end_errors = _poll_counters(hass)
+
+    counts = [end - start for start, end in zip(start_counts, end_counts, strict=True)]
+    errors = end_errors - start_errors
+    polls = sum(counts) + errors.total()
+    loaded = len(hass.config_entries.async_loaded_entries(DOMAIN))
+    return {
+        "devices": args.devices,
+        "loaded_entries": loaded,
+        "interval": args.interval,
+        "duration": round(window, 3),
+        "setup_seconds": round(setup_seconds, 3),
+        "memory_per_entry_kib": round(traced / max(1, loaded) / 1024, 1),
+        "polls": polls,
+        "polls_per_second": round(polls / window, 2),
+        "nominal_polls_per_second": round(args.devices / args.interval, 2),
+        "failures": errors.total(),
+        "errors": dict(errors),
+        "fetch_latency_seconds": _histogram_percentiles(_latency_buckets(hass), counts),
+        "loop_lag_seconds": {
+            **_percentiles(monitor.samples),
+            "max": max(monitor.samples, default=None),
+        },
+    }
+
+
+def _print_report(report: dict[str, Any]) -> None:
+    """Print the report in a readable form."""
+    latency = report["fetch_latency_seconds"]
+    lag = report["loop_lag_seconds"]
+    print(f"Entries loaded     {report['loaded_entries']} / {report['devices']}")
+    print(f"Setup              {report['setup_seconds']} s")
+    print(f"Memory per entry   {report['memory_per_entry_kib']} KiB")
+    print(
+        f"Polls              {report['polls']} in {report['duration']} s, "
+        f"{report['polls_per_second']}/s "
+        f"(nominal {report['nominal_polls_per_second']}/s)"
+    )
+    print(f"Failures           {report['failures']} {report['errors'] or ''}")
+    print(
+        "Fetch latency      "
+        + ", ".join(f"{name} <= {value} s" for name, value in latency.items())
+    )
+    print(
+        "Event loop lag     "
+        + ", ".join(
+            f"{name} {value * 1000:.1f} ms"
+            for name, value in lag.items()
+            if value is not None
+        )
+    )
+
+
+def main() -> None:
+    """Run the load test from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    add_behavior_arguments(parser)
+    parser.add_argument("--interval", type=int, default=10, help="poll seconds")
+    parser.add_argument("--timeout", type=int, default=5, help="client seconds")
+    parser.add_argument("--duration", type=float, default=60, help="seconds")
+    parser.add_argument("--json", type=Path, help="save the report to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    # The coordinators log every failed poll, which the report already counts
+    logging.getLogger("custom_components.bopi").setLevel(logging.CRITICAL)
+
+    report = asyncio.run(async_run(args))
+    _print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
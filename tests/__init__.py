@@ -0,0 +1 @@
+"""Tests for the BoPi integration."""
@@ -0,0 +1,110 @@
+"""Fixtures for BoPi tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator, Callable, Generator
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from meetbopi import BoPiClient
+from meetbopi.exceptions import BoPiConnectionError
+from meetbopi.sensors_state import SensorsState
+
+from homeassistant import bootstrap, loader
+from homeassistant.components.network.network import async_get_network
+from homeassistant.config_entries import SOURCE_USER, ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.bopi.const import DOMAIN
+
+REPOSITORY = Path(__file__).resolve().parent.parent
+
+# allsensorsv2 answer of a controller, pump on and second probe unplugged
+SENSORS_PAYLOAD: dict[str, Any] = {
+    "temp1": 27.5,
+    "temp2": -127,
+    "boxtemp": 31.2,
+    "boxhumidity": 48,
+    "phvalue": 7.21,
+    "redoxvalue": 684,
+    "mode": "auto",
+    "uptime": 3600,
+    "lphi": 0,
+    "tphi": 0,
+    "lorpi": 0,
+    "torpi": 0,
+    "poolPump": {"status": 1, "override": 0, "timeleft": 0},
+    "poolLights": {"status": 0, "override": 0, "timeleft": 0},
+    **{
+        f"relay{index}": {"status": 0, "override": 0, "timeleft": 0, "role": "none"}
+        for index in range(1, 5)
+    },
+}
+
+
+class Clock:
+    """Monotonic clock of a module, moved by the tests."""
+
+    def __init__(self) -> None:
+        """Start the clock."""
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        """Return the current time."""
+        return self.now
+
+
+@pytest.fixture
+async def hass(tmp_path: Path) -> AsyncGenerator[HomeAssistant]:
+    """Return a Home Assistant instance loading the integration of the repo."""
+    (tmp_path / "custom_components").symlink_to(REPOSITORY / "custom_components")
+    hass = HomeAssistant(str(tmp_path))
+    hass.config.skip_pip = True
+    hass.config_entries = ConfigEntries(hass, {})
+    loader.async_setup(hass)
+    await bootstrap.async_load_base_functionality(hass)
+    await async_get_network(hass)
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest.fixture
+def reachable_hosts() -> Generator[set[str]]:
+    """Answer the BoPi clients of the hosts in the returned set.
+
+    Clients of other hosts fail to connect.
+    """
+    hosts: set[str] = set()
+
+    async def _get_sensors_state(self: BoPiClient) -> SensorsState:
+        if self.host not in hosts:
+            raise BoPiConnectionError(f"Cannot connect to {self.host}")
+        self.sensors_state = SensorsState.from_dict(SENSORS_PAYLOAD)
+        return self.sensors_state
+
+    with patch.object(BoPiClient, "get_sensors_state", _get_sensors_state):
+        yield hosts
+
+
+@pytest.fixture
+def create_config_entry() -> Callable[..., ConfigEntry]:
+    """Return a factory of BoPi config entries, not added to Home Assistant."""
+
+    def _create(host: str, options: dict[str, Any] | None = None) -> ConfigEntry:
+        return ConfigEntry(
+            data={"host": host, "port": 80, "timeout": 5},
+            discovery_keys=MappingProxyType({}),
+            domain=DOMAIN,
+            minor_version=1,
+            options=options or {},
+            source=SOURCE_USER,
+            subentries_data=None,
+            title=f"BoPi ({host})",
+            unique_id=f"BoPi ({host})",
+            version=1,
+        )
+
+    return _create
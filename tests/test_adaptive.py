@@ -0,0 +1,97 @@
+"""Tests for the BoPi adaptive poll interval."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from custom_components.bopi.adaptive import AdaptivePollInterval
+from custom_components.bopi.const import (
+    DEFAULT_MAX_POLL_INTERVAL,
+    DEFAULT_MIN_POLL_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+)
+
+STABLE = {"phvalue": 7.2, "temp1": 27.5}
+
+
+def _moving() -> AdaptivePollInterval:
+    """Return an interval that has seen a first reading."""
+    adaptive = AdaptivePollInterval(base=60, floor=15, ceiling=600)
+    adaptive.record_success(STABLE)
+    return adaptive
+
+
+def test_first_poll_keeps_base() -> None:
+    """Without a previous reading there is nothing to compare to."""
+    adaptive = AdaptivePollInterval(base=60, floor=15, ceiling=600)
+
+    assert adaptive.record_success(STABLE) == timedelta(seconds=60)
+
+
+def test_speeds_up_to_floor() -> None:
+    """Moving readings halve the interval down to the floor."""
+    adaptive = _moving()
+    steps = [
+        adaptive.record_success({"phvalue": 7.2 + 0.1 * i}).total_seconds()
+        for i in range(1, 4)
+    ]
+
+    assert steps == [30, 15, 15]
+
+
+def test_slows_down_to_ceiling() -> None:
+    """Flat readings stretch the interval by half up to the ceiling."""
+    adaptive = _moving()
+    steps = [adaptive.record_success(STABLE).total_seconds() for _ in range(7)]
+
+    assert steps == [90, 135, 202.5, 303.75, 455.625, 600, 600]
+
+
+def test_movement_below_threshold_is_flat() -> None:
+    """Noise within the change thresholds does not speed polling up."""
+    adaptive = _moving()
+
+    assert adaptive.record_success({"phvalue": 7.24, "temp1": 27.6}) == timedelta(
+        seconds=90
+    )
+
+
+def test_disconnected_probe_is_movement() -> None:
+    """A probe going away or coming back counts as a change."""
+    adaptive = _moving()
+
+    assert adaptive.record_success({"phvalue": None, "temp1": 27.5}) == timedelta(
+        seconds=30
+    )
+    assert adaptive.record_success(STABLE) == timedelta(seconds=15)
+
+
+def test_failures_back_off_from_base() -> None:
+    """Failures double the base interval up to the ceiling, success resets it."""
+    adaptive = _moving()
+    adaptive.record_success({"phvalue": 8.0})
+
+    steps = [adaptive.record_failure().total_seconds() for _ in range(5)]
+    assert steps == [120, 240, 480, 600, 600]
+
+    assert adaptive.record_success(STABLE) == timedelta(seconds=60)
+    assert adaptive.failures == 0
+
+
+def test_bounds_are_consistent() -> None:
+    """The base stays within the floor and the ceiling."""
+    assert AdaptivePollInterval(base=60, floor=120, ceiling=600).base == 120
+    assert AdaptivePollInterval(base=60, floor=120, ceiling=30).ceiling == 120
+    assert AdaptivePollInterval(base=900, floor=15, ceiling=600).base == 600
+
+
+def test_defaults_speed_up() -> None:
+    """With the default options adaptive polling goes below the scan interval."""
+    adaptive = AdaptivePollInterval(
+        DEFAULT_SCAN_INTERVAL, DEFAULT_MIN_POLL_INTERVAL, DEFAULT_MAX_POLL_INTERVAL
+    )
+    adaptive.record_success(STABLE)
+
+    assert adaptive.record_success({"phvalue": 8.0}) < timedelta(
+        seconds=DEFAULT_SCAN_INTERVAL
+    )
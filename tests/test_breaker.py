@@ -0,0 +1,113 @@
+"""Tests for the BoPi circuit breaker."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.bopi.breaker import BreakerState, CircuitBreaker
+
+from .conftest import Clock
+
+
+@pytest.fixture
+def clock() -> Generator[Clock]:
+    """Control the monotonic clock of the circuit breaker."""
+    clock = Clock()
+    with patch("custom_components.bopi.breaker.monotonic", clock):
+        yield clock
+
+
+@pytest.fixture
+def breaker() -> CircuitBreaker:
+    """Return a breaker opening after 3 failures, probing after 60 to 240 s."""
+    return CircuitBreaker(failure_threshold=3, base_backoff=60, max_backoff=240)
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    """Fail requests until the circuit opens."""
+    for _ in range(breaker.failure_threshold):
+        assert breaker.allow_request()
+        breaker.record_failure()
+
+
+@pytest.mark.usefixtures("clock")
+def test_opens_at_threshold(breaker: CircuitBreaker) -> None:
+    """The circuit stays closed below the threshold and opens at it."""
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.allow_request()
+
+    breaker.record_failure()
+    assert breaker.state is BreakerState.OPEN
+    assert breaker.trips == 1
+    assert breaker.retry_in == 60
+    assert not breaker.allow_request()
+    assert breaker.short_circuits == 1
+
+
+@pytest.mark.usefixtures("clock")
+def test_success_resets_failure_count(breaker: CircuitBreaker) -> None:
+    """Failures must be consecutive to open the circuit."""
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.consecutive_failures == 2
+
+
+def test_half_open_probe_after_cool_down(breaker: CircuitBreaker, clock: Clock) -> None:
+    """A single probe goes through once the backoff has elapsed."""
+    _trip(breaker)
+
+    clock.now += 59
+    assert not breaker.allow_request()
+    clock.now += 1
+    assert breaker.allow_request()
+    assert breaker.state is BreakerState.HALF_OPEN
+    assert breaker.probes == 1
+
+
+def test_failed_probes_double_the_backoff(
+    breaker: CircuitBreaker, clock: Clock
+) -> None:
+    """Each failed probe doubles the backoff, up to its maximum."""
+    _trip(breaker)
+
+    for backoff in (120, 240, 240):
+        clock.now += breaker.retry_in
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is BreakerState.OPEN
+        assert breaker.retry_in == backoff
+    # Failed probes do not count as new trips
+    assert breaker.trips == 1
+
+
+def test_successful_probe_closes_the_circuit(
+    breaker: CircuitBreaker, clock: Clock
+) -> None:
+    """A successful probe closes the circuit and resets the backoff."""
+    _trip(breaker)
+    clock.now += breaker.retry_in
+    assert breaker.allow_request()
+    breaker.record_failure()
+    clock.now += breaker.retry_in
+    assert breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state is BreakerState.CLOSED
+    assert breaker.consecutive_failures == 0
+    assert breaker.retry_in == 0
+    assert breaker.allow_request()
+
+    # The next trip starts over from the base backoff
+    _trip(breaker)
+    assert breaker.trips == 2
+    assert breaker.retry_in == 60
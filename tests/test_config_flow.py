@@ -0,0 +1,70 @@
+"""Tests for the BoPi config flow."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.config_entries import (
+    SOURCE_RECONFIGURE,
+    ConfigEntry,
+    ConfigEntryState,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+from custom_components.bopi.const import DOMAIN
+from custom_components.bopi.coordinator import snapshot_store
+
+OLD_HOST = "192.0.2.10"
+NEW_HOST = "192.0.2.20"
+
+
+async def test_reconfigure_host_of_entry_retrying_setup(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """Entities of an entry retrying its setup move to the new host."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+    config_entry = create_config_entry(OLD_HOST)
+
+    # Entities created while the controller answered on its old address
+    reachable_hosts.add(OLD_HOST)
+    await hass.config_entries.async_add(config_entry)
+    await hass.async_block_till_done()
+    entity_id = entity_registry.async_get_entity_id(
+        "sensor", DOMAIN, f"{OLD_HOST}_phvalue"
+    )
+    assert entity_id is not None
+    assert await hass.config_entries.async_unload(config_entry.entry_id)
+
+    # The controller moved; without a snapshot the setup needs a live poll
+    await snapshot_store(hass, config_entry.entry_id).async_remove()
+    reachable_hosts.clear()
+    await hass.config_entries.async_setup(config_entry.entry_id)
+    assert config_entry.state is ConfigEntryState.SETUP_RETRY
+
+    reachable_hosts.add(NEW_HOST)
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN,
+        context={"source": SOURCE_RECONFIGURE, "entry_id": config_entry.entry_id},
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"host": NEW_HOST, "port": 80, "timeout": 5}
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "reconfigure_successful"
+    assert config_entry.state is ConfigEntryState.LOADED
+    assert config_entry.unique_id == f"BoPi ({NEW_HOST})"
+    assert config_entry.title == f"BoPi ({NEW_HOST})"
+    assert (
+        entity_registry.async_get_entity_id("sensor", DOMAIN, f"{NEW_HOST}_phvalue")
+        == entity_id
+    )
+    assert hass.states.get(entity_id).state == "7.21"
+    assert device_registry.async_get_device(identifiers={(DOMAIN, NEW_HOST)})
+    assert not device_registry.async_get_device(identifiers={(DOMAIN, OLD_HOST)})
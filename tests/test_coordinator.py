@@ -0,0 +1,55 @@
+"""Tests for the BoPi coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+
+from custom_components.bopi.const import DOMAIN
+
+HOST = "192.0.2.10"
+SAVE_DELAY = 0.2
+
+
+async def test_polls_do_not_postpone_snapshot_save(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """Polls within the save delay lead to a single write, on time."""
+    writes: list[dict[str, Any]] = []
+
+    reachable_hosts.add(HOST)
+    config_entry = create_config_entry(HOST)
+
+    async def _write_data(_: Store[Any], data: dict[str, Any]) -> None:
+        # The registries are saved through stores as well
+        if data["key"] == f"{DOMAIN}.{config_entry.entry_id}":
+            writes.append(data["data_func"]() if "data_func" in data else data["data"])
+
+    with (
+        patch("custom_components.bopi.coordinator.SNAPSHOT_SAVE_DELAY", SAVE_DELAY),
+        patch.object(Store, "_async_write_data", _write_data),
+    ):
+        await hass.config_entries.async_add(config_entry)
+        await hass.async_block_till_done()
+        coordinator = config_entry.runtime_data.coordinator
+
+        # Polling more often than the delay, the write must not wait for a pause
+        for _ in range(3):
+            await asyncio.sleep(SAVE_DELAY / 4)
+            await coordinator.async_refresh()
+        await asyncio.sleep(SAVE_DELAY / 2)
+        assert len(writes) == 1
+        assert writes[0]["fetched_at"] == coordinator.data["fetched_at"].isoformat()
+
+        # The next poll schedules the next write
+        await coordinator.async_refresh()
+        await asyncio.sleep(SAVE_DELAY * 1.5)
+        assert len(writes) == 2
@@ -0,0 +1,78 @@
+"""Tests for the BoPi time-series export."""
+
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from custom_components.bopi.const import CONF_EXPORT_FORMAT, EXPORT_FILES
+from custom_components.bopi.export import DATA_EXPORT, ExportWriter
+
+HOSTS = ("192.0.2.10", "192.0.2.11")
+
+
+def test_writer_must_implement_write() -> None:
+    """A writer without write cannot be created."""
+    with pytest.raises(TypeError):
+        ExportWriter()  # type: ignore[abstract]
+
+
+async def test_sink_closed_by_last_entry(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """The shared sink writes its samples and goes away with its last user."""
+    reachable_hosts.update(HOSTS)
+    entries = [create_config_entry(host, {CONF_EXPORT_FORMAT: "csv"}) for host in HOSTS]
+    for entry in entries:
+        await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    sink = hass.data[DATA_EXPORT]["csv"]
+    assert sink.users == 2
+
+    assert await hass.config_entries.async_unload(entries[0].entry_id)
+    assert hass.data[DATA_EXPORT]["csv"] is sink
+    assert sink.users == 1
+
+    assert await hass.config_entries.async_unload(entries[1].entry_id)
+    assert DATA_EXPORT not in hass.data
+    assert not sink.queued
+
+    with Path(hass.config.path(EXPORT_FILES["csv"])).open(encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert {row["host"] for row in rows} == set(HOSTS)
+    assert {row["phvalue"] for row in rows} == {"7.21"}
+
+
+async def test_sink_released_when_export_turned_off(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """Turning the export off removes the sink and its timer."""
+    reachable_hosts.add(HOSTS[0])
+    entry = create_config_entry(HOSTS[0], {CONF_EXPORT_FORMAT: "line_protocol"})
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    sink = hass.data[DATA_EXPORT]["line_protocol"]
+    listeners = hass.bus.async_listeners()
+
+    hass.config_entries.async_update_entry(entry, options={CONF_EXPORT_FORMAT: "off"})
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.runtime_data.coordinator.export is None
+    assert DATA_EXPORT not in hass.data
+    assert sink.users == 0
+    assert sum(hass.bus.async_listeners().values()) < sum(listeners.values())
+    assert (
+        Path(hass.config.path(EXPORT_FILES["line_protocol"]))
+        .read_text(encoding="utf-8")
+        .startswith(f"bopi,host={HOSTS[0]} ")
+    )
@@ -0,0 +1,130 @@
+"""Tests for the BoPi sample filter."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from dataclasses import replace
+from unittest.mock import patch
+
+import pytest
+from meetbopi.sensors_state import SensorsState
+
+from custom_components.bopi.filters import (
+    PublishRule,
+    SampleFilter,
+    disconnected_sensors,
+    mask_sentinels,
+)
+
+from .conftest import SENSORS_PAYLOAD, Clock
+
+MAX_AGE = 900
+
+
+@pytest.fixture
+def clock() -> Generator[Clock]:
+    """Control the monotonic clock of the filter."""
+    clock = Clock()
+    with patch("custom_components.bopi.filters.monotonic", clock):
+        yield clock
+
+
+@pytest.fixture
+def sample_filter() -> SampleFilter:
+    """Return a filter with a deadband of 0.5 on pH and on water temperature."""
+    rule = PublishRule(deadband=0.5, max_age=MAX_AGE)
+    return SampleFilter({"phvalue": rule, "temp1": rule})
+
+
+def _state(**readings: float | None) -> SensorsState:
+    """Return a sensors state with some readings replaced."""
+    return replace(SensorsState.from_dict(SENSORS_PAYLOAD), **readings)
+
+
+@pytest.mark.usefixtures("clock")
+@pytest.mark.parametrize(
+    ("reading", "published"),
+    [
+        (7.25, 7.0),
+        (6.75, 7.0),
+        (7.5, 7.5),
+        (6.5, 6.5),
+    ],
+)
+def test_deadband_boundary(
+    sample_filter: SampleFilter, reading: float, published: float
+) -> None:
+    """Changes smaller than the deadband are held, changes of it are published."""
+    sample_filter.apply(_state(phvalue=7.0))
+
+    assert sample_filter.apply(_state(phvalue=reading)).phvalue == published
+
+
+@pytest.mark.usefixtures("clock")
+def test_held_readings_do_not_move_the_reference(
+    sample_filter: SampleFilter,
+) -> None:
+    """A slow drift is published once it leaves the deadband of the last value."""
+    sample_filter.apply(_state(phvalue=7.0))
+
+    assert sample_filter.apply(_state(phvalue=7.25)).phvalue == 7.0
+    assert sample_filter.apply(_state(phvalue=7.45)).phvalue == 7.0
+    assert sample_filter.apply(_state(phvalue=7.5)).phvalue == 7.5
+    assert sample_filter.apply(_state(phvalue=7.75)).phvalue == 7.5
+
+
+@pytest.mark.usefixtures("clock")
+def test_jumps_are_published_at_once(sample_filter: SampleFilter) -> None:
+    """The filter holds noise back but never rejects a large jump."""
+    sample_filter.apply(_state(phvalue=7.0, temp1=27.5))
+
+    state = sample_filter.apply(_state(phvalue=9.0, temp1=20.0))
+    assert (state.phvalue, state.temp1) == (9.0, 20.0)
+    # The jump is the new reference, so going back is published too
+    assert sample_filter.apply(_state(phvalue=7.0)).phvalue == 7.0
+
+
+def test_heartbeat_publishes_held_reading(
+    sample_filter: SampleFilter, clock: Clock
+) -> None:
+    """A reading within the deadband is published once the last one is too old."""
+    sample_filter.apply(_state(phvalue=7.0))
+
+    clock.now += MAX_AGE - 1
+    assert sample_filter.apply(_state(phvalue=7.25)).phvalue == 7.0
+    clock.now += 1
+    assert sample_filter.apply(_state(phvalue=7.25)).phvalue == 7.25
+    # The heartbeat restarts from the reading it published
+    clock.now += 1
+    assert sample_filter.apply(_state(phvalue=7.0)).phvalue == 7.25
+
+
+@pytest.mark.usefixtures("clock")
+def test_disconnected_probe_passes_through(sample_filter: SampleFilter) -> None:
+    """A probe going away or coming back is published at once."""
+    sample_filter.apply(_state(phvalue=7.0))
+
+    assert sample_filter.apply(_state(phvalue=None)).phvalue is None
+    assert sample_filter.apply(_state(phvalue=7.25)).phvalue == 7.25
+
+
+@pytest.mark.usefixtures("clock")
+def test_unfiltered_sensors_pass_through(sample_filter: SampleFilter) -> None:
+    """Sensors without a rule and unchanged states are left alone."""
+    state = _state(phvalue=7.0, redoxvalue=684)
+    assert sample_filter.apply(state) is state
+
+    state = _state(phvalue=7.25, redoxvalue=685)
+    assert sample_filter.apply(state).redoxvalue == 685
+
+
+def test_sentinels_masked() -> None:
+    """Sentinel readings of disconnected probes become missing values."""
+    state = _state(temp1=-127, phvalue=-127)
+
+    masked = mask_sentinels(state)
+
+    assert (masked.temp1, masked.phvalue, masked.redoxvalue) == (None, None, 684)
+    assert disconnected_sensors(masked) == {"temp1", "temp2", "phvalue"}
+    unchanged = _state()
+    assert mask_sentinels(unchanged) is unchanged
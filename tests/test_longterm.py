@@ -0,0 +1,149 @@
+"""Tests for the BoPi hourly long-term statistics."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Generator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from custom_components.bopi.const import CONF_LONG_TERM_STATISTICS
+from custom_components.bopi.longterm import (
+    RECORDER_DOMAIN,
+    BoPiLongTermStatistics,
+    HourlyBucket,
+)
+
+HOST = "192.0.2.10"
+HOUR = datetime(2026, 10, 17, 10, tzinfo=UTC)
+
+
+@pytest.fixture
+def add_statistics(hass: HomeAssistant) -> Generator[MagicMock]:
+    """Record the statistics imported into a loaded recorder."""
+    hass.config.components.add(RECORDER_DOMAIN)
+    with patch(
+        "custom_components.bopi.longterm.async_add_external_statistics"
+    ) as add_statistics:
+        yield add_statistics
+
+
+def _imported(add_statistics: MagicMock) -> dict[str, list[Any]]:
+    """Return the imported rows of each statistic ID."""
+    imported: dict[str, list[Any]] = {}
+    for call in add_statistics.call_args_list:
+        _, metadata, statistics = call.args
+        imported.setdefault(metadata["statistic_id"], []).extend(statistics)
+    return imported
+
+
+async def test_hour_imported_once_over(
+    hass: HomeAssistant, add_statistics: MagicMock
+) -> None:
+    """An hour is imported at the first reading of the next one."""
+    statistics = BoPiLongTermStatistics(hass, "ENTRY", "BoPi")
+    statistics.add(HOUR + timedelta(minutes=10), {"phvalue": 7.0, "temp1": 27.0})
+    statistics.add(HOUR + timedelta(minutes=40), {"phvalue": 7.4, "temp1": 28.0})
+    add_statistics.assert_not_called()
+
+    statistics.add(
+        HOUR + timedelta(hours=1, minutes=5), {"phvalue": 7.2, "temp1": 28.5}
+    )
+
+    imported = _imported(add_statistics)
+    assert imported["bopi:entry_phvalue"] == [
+        {"start": HOUR, "mean": pytest.approx(7.2), "min": 7.0, "max": 7.4}
+    ]
+    assert imported["bopi:entry_temp1"] == [
+        {"start": HOUR, "mean": 27.5, "min": 27.0, "max": 28.0}
+    ]
+    metadata = add_statistics.call_args_list[0].args[1]
+    assert metadata["name"] == "BoPi pH level"
+    assert statistics.imported_hours == 2
+
+
+async def test_restore_hour_in_progress(
+    hass: HomeAssistant, add_statistics: MagicMock
+) -> None:
+    """A stored hour in progress goes on with the readings taken since."""
+    before = BoPiLongTermStatistics(hass, "ENTRY", "BoPi")
+    before.add(HOUR + timedelta(minutes=10), {"phvalue": 7.0})
+    stored = before.buckets_to_store()
+
+    after = BoPiLongTermStatistics(hass, "ENTRY", "BoPi")
+    after.restore(stored)
+    after.add(HOUR + timedelta(minutes=50), {"phvalue": 7.6})
+    assert after.buckets_to_store()["phvalue"]["count"] == 2
+    add_statistics.assert_not_called()
+
+    after.add(HOUR + timedelta(hours=1), {"phvalue": 7.2})
+    assert _imported(add_statistics)["bopi:entry_phvalue"] == [
+        {"start": HOUR, "mean": pytest.approx(7.3), "min": 7.0, "max": 7.6}
+    ]
+
+
+async def test_restore_hour_over(
+    hass: HomeAssistant, add_statistics: MagicMock
+) -> None:
+    """A stored hour that is over is imported, whatever else is running."""
+    before = BoPiLongTermStatistics(hass, "ENTRY", "BoPi")
+    before.add(HOUR + timedelta(minutes=10), {"phvalue": 7.0})
+    stored = before.buckets_to_store()
+
+    after = BoPiLongTermStatistics(hass, "ENTRY", "BoPi")
+    after.add(HOUR + timedelta(hours=2), {"phvalue": 7.2})
+    after.restore(stored)
+
+    assert _imported(add_statistics)["bopi:entry_phvalue"] == [
+        {"start": HOUR, "mean": 7.0, "min": 7.0, "max": 7.0}
+    ]
+    assert after.buckets_to_store()["phvalue"]["count"] == 1
+
+
+@pytest.mark.parametrize(
+    "stored",
+    [
+        {"start": "not a date", "count": 1, "total": 7, "minimum": 7, "maximum": 7},
+        {"start": HOUR.isoformat(), "count": 0, "total": 0, "minimum": 0, "maximum": 0},
+    ],
+)
+def test_invalid_stored_bucket(stored: dict[str, Any]) -> None:
+    """Stored buckets without readings or start are rejected."""
+    with pytest.raises(ValueError):
+        HourlyBucket.from_dict(stored)
+
+
+async def test_hour_in_progress_survives_reload(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+    add_statistics: MagicMock,
+) -> None:
+    """Reloading an entry neither imports nor loses the hour in progress."""
+    reachable_hosts.add(HOST)
+    config_entry = create_config_entry(HOST, {CONF_LONG_TERM_STATISTICS: True})
+    now = HOUR + timedelta(minutes=30)
+    with patch.object(dt_util, "utcnow", side_effect=lambda: now):
+        await hass.config_entries.async_add(config_entry)
+        await hass.async_block_till_done()
+        assert await hass.config_entries.async_reload(config_entry.entry_id)
+        await hass.async_block_till_done()
+
+        coordinator = config_entry.runtime_data.coordinator
+        assert (long_term := coordinator.long_term) is not None
+        # The poll before the reload and the one after it
+        assert long_term.buckets_to_store()["phvalue"]["count"] == 2
+        add_statistics.assert_not_called()
+
+        now += timedelta(hours=1)
+        await coordinator.async_refresh()
+
+    assert _imported(add_statistics)[long_term.statistic_id("phvalue")] == [
+        {"start": HOUR, "mean": pytest.approx(7.21), "min": 7.21, "max": 7.21}
+    ]
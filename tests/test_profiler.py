@@ -0,0 +1,136 @@
+"""Tests for the BoPi profiler."""
+
+from __future__ import annotations
+
+import cProfile
+import sys
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+
+from custom_components.bopi.const import DOMAIN
+from custom_components.bopi.coordinator import BoPiCoordinator
+from custom_components.bopi.profiler import DATA_PROFILE, async_start_profile
+
+HOSTS = ("192.0.2.10", "192.0.2.11")
+
+
+async def _async_setup_coordinators(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> list[BoPiCoordinator]:
+    """Set up one entry per host and return their coordinators."""
+    reachable_hosts.update(HOSTS)
+    entries = [create_config_entry(host) for host in HOSTS]
+    for entry in entries:
+        await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+    return [entry.runtime_data.coordinator for entry in entries]
+
+
+def _profiler_active() -> bool:
+    """Return whether a profiler is enabled."""
+    return sys.monitoring.get_tool(sys.monitoring.PROFILER_ID) is not None
+
+
+async def test_release_in_the_middle_of_a_cycle(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """A coordinator released during its cycle leaves the session consistent."""
+    first, second = await _async_setup_coordinators(
+        hass, reachable_hosts, create_config_entry
+    )
+    path = async_start_profile(hass, [first, second], 1)
+    session = hass.data[DATA_PROFILE]
+
+    session.cycle_started(first)
+    session.cycle_started(second)
+    # The entry of the first coordinator unloads while both poll
+    session.release(first)
+    session.cycle_finished(first)
+    assert first.profile is None
+    assert _profiler_active()
+
+    session.cycle_finished(second)
+    assert not _profiler_active()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    assert DATA_PROFILE not in hass.data
+    assert Path(path).exists()
+
+
+async def test_cycles_outside_the_session_are_ignored(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """Cycles of coordinators not profiled do not touch the profiler."""
+    first, second = await _async_setup_coordinators(
+        hass, reachable_hosts, create_config_entry
+    )
+    async_start_profile(hass, [first], 2)
+    session = hass.data[DATA_PROFILE]
+
+    session.cycle_started(second)
+    assert not _profiler_active()
+    session.cycle_finished(second)
+    # Finishing a cycle that was never started is ignored as well
+    session.cycle_finished(first)
+    assert first.profile is session
+    assert not _profiler_active()
+
+
+async def test_profile_service_with_another_profiler_active(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """The service fails cleanly while another profiler runs."""
+    coordinators = await _async_setup_coordinators(
+        hass, reachable_hosts, create_config_entry
+    )
+    other = cProfile.Profile()
+    other.enable()
+    try:
+        with pytest.raises(HomeAssistantError) as err:
+            await hass.services.async_call(
+                DOMAIN, "profile", {"cycles": 1}, blocking=True, return_response=True
+            )
+    finally:
+        other.disable()
+
+    assert err.value.translation_key == "profiler_unavailable"
+    assert DATA_PROFILE not in hass.data
+    assert all(coordinator.profile is None for coordinator in coordinators)
+
+
+async def test_session_abandoned_when_another_profiler_takes_over(
+    hass: HomeAssistant,
+    reachable_hosts: set[str],
+    create_config_entry: Callable[..., ConfigEntry],
+) -> None:
+    """A session that cannot enable its profiler stops profiling."""
+    first, second = await _async_setup_coordinators(
+        hass, reachable_hosts, create_config_entry
+    )
+    async_start_profile(hass, [first, second], 1)
+    session = hass.data[DATA_PROFILE]
+
+    other = cProfile.Profile()
+    other.enable()
+    try:
+        session.cycle_started(first)
+        session.cycle_finished(first)
+    finally:
+        other.disable()
+
+    assert DATA_PROFILE not in hass.data
+    assert first.profile is None
+    assert second.profile is None